@@ -0,0 +1,233 @@
+import time
+from difflib import Match, SequenceMatcher
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_BAND_WIDTH = 10.0  # seconds
+
+
+def _fill_times(times: Optional[np.ndarray], count: int, duration: float) -> np.ndarray:
+    """
+    Interpolate missing (NaN) times over the word index, or spread the words evenly over
+    the duration if none of them has a time.
+    """
+    if times is None or not np.any(~np.isnan(times)):
+        return np.linspace(0, duration, count, endpoint=False)
+
+    indices = np.arange(count)
+    known = ~np.isnan(times)
+    return np.interp(indices, indices[known], times[known])
+
+
+def _get_bands(a_times, b_times, band_width):
+    """
+    Range [lo, hi) of words of b that each word of a may be matched with, widened where
+    necessary so that both bounds never decrease.
+    """
+    lo = np.searchsorted(b_times, a_times - band_width, side="left")
+    hi = np.searchsorted(b_times, a_times + band_width, side="right")
+
+    lo = np.minimum.accumulate(lo[::-1])[::-1]
+    hi = np.maximum.accumulate(hi)
+
+    return lo, hi
+
+
+def banded_alignment(
+    a: list,
+    b: list,
+    a_times: Optional[np.ndarray] = None,
+    b_times: Optional[np.ndarray] = None,
+    band_width=DEFAULT_BAND_WIDTH,
+) -> list[Match]:
+    """
+    Longest common subsequence of a and b, where an item of a may only be matched with
+    items of b whose time is within band_width seconds of its own.
+
+    Times may contain NaN for items without timing. Returns the matching blocks in the
+    format of SequenceMatcher.get_matching_blocks, including the final dummy block.
+    """
+    n, m = len(a), len(b)
+    if not n or not m:
+        return [Match(n, m, 0)]
+
+    codes = {}
+    a_codes = np.array([codes.setdefault(item, len(codes)) for item in a])
+    b_codes = np.array([codes.setdefault(item, len(codes)) for item in b])
+
+    a_times = None if a_times is None else np.asarray(a_times, dtype=np.float64)
+    b_times = None if b_times is None else np.asarray(b_times, dtype=np.float64)
+
+    # without times on one side, place its words proportionally on the other side's span
+    a_known = a_times is not None and np.any(~np.isnan(a_times))
+    b_known = b_times is not None and np.any(~np.isnan(b_times))
+    duration = max(
+        np.nanmax(a_times) if a_known else 0, np.nanmax(b_times) if b_known else 0, 1
+    )
+    a_times = _fill_times(a_times, n, duration)
+    b_times = np.maximum.accumulate(_fill_times(b_times, m, duration))
+
+    lo, hi = _get_bands(a_times, b_times, band_width)
+
+    # row[j] is the length of the longest common subsequence of the words of a so far
+    # and b[:j]. Gaps are free, so a row is the running maximum of the diagonal and
+    # vertical candidates and only the band needs to be computed. Cells right of every
+    # band so far equal the end of the last band
+    row = np.zeros(m + 1, dtype=np.int32)
+    bands = []
+    last_end = 0
+    filled = 1
+
+    for i in range(n):
+        c0, c1 = lo[i] + 1, hi[i] + 1
+
+        if c1 > filled:
+            row[filled:c1] = last_end
+            filled = c1
+
+        if c0 >= c1:
+            bands.append((c0, c1, None))
+            continue
+
+        diagonal = row[c0 - 1 : c1 - 1] + (b_codes[c0 - 1 : c1 - 1] == a_codes[i])
+        values = np.maximum(row[c0:c1], diagonal)
+        values[0] = max(values[0], row[c0 - 1])
+        values = np.maximum.accumulate(values)
+
+        row[c0:c1] = values
+        last_end = values[-1]
+        bands.append((c0, c1, values))
+
+    def value(i, j):
+        while i > 0:
+            c0, c1, values = bands[i - 1]
+            if values is not None and c0 <= j < c1:
+                return values[j - c0]
+            if values is not None and j >= c1:
+                return values[-1]
+            i -= 1
+        return 0
+
+    pairs = []
+    i, j = n, m
+    while i > 0 and j > 0:
+        c0, c1, values = bands[i - 1]
+
+        if values is None or j < c0:
+            i -= 1
+        elif j >= c1:
+            j = c1 - 1
+        elif (
+            a_codes[i - 1] == b_codes[j - 1]
+            and values[j - c0] == value(i - 1, j - 1) + 1
+        ):
+            pairs.append((i - 1, j - 1))
+            i -= 1
+            j -= 1
+        elif values[j - c0] == value(i - 1, j):
+            i -= 1
+        else:
+            j -= 1
+
+    blocks = []
+    for a_index, b_index in reversed(pairs):
+        if blocks:
+            block = blocks[-1]
+            if block.a + block.size == a_index and block.b + block.size == b_index:
+                blocks[-1] = Match(block.a, block.b, block.size + 1)
+                continue
+        blocks.append(Match(a_index, b_index, 1))
+
+    blocks.append(Match(n, m, 0))
+    return blocks
+
+
+def _synthetic_lyrics(num_words, rng, vocabulary_size=40, error_rate=0.1):
+    """
+    Repetitive lyrics with word times and a noisy transcription of them, and the
+    index pairs of words that correspond to each other.
+    """
+    vocabulary = [f"word{i}" for i in range(vocabulary_size)]
+    chorus = list(rng.choice(vocabulary, 24))
+
+    words = []
+    while len(words) < num_words:
+        if rng.random() < 0.5:
+            words.extend(chorus)
+        else:
+            words.extend(rng.choice(vocabulary, 16))
+    words = words[:num_words]
+    times = np.cumsum(rng.uniform(0.2, 0.6, num_words))
+
+    transcribed, transcribed_times, truth = [], [], []
+    for i, (word, t) in enumerate(zip(words, times)):
+        r = rng.random()
+        if r < error_rate / 3:
+            continue  # deleted
+        if r < 2 * error_rate / 3:
+            transcribed.append(rng.choice(vocabulary))  # inserted
+            transcribed_times.append(t - 0.1)
+        if r < error_rate:
+            word = rng.choice(vocabulary)  # substituted
+        else:
+            truth.append((i, len(transcribed)))
+        transcribed.append(word)
+        transcribed_times.append(t + rng.normal(0, 0.3))
+
+    return words, times, transcribed, np.array(transcribed_times), set(truth)
+
+
+def benchmark_alignment(
+    sizes=(100, 1000, 10000), band_width=DEFAULT_BAND_WIDTH, seed=0
+) -> dict:
+    """
+    Align synthetic lyrics with their noisy transcription with SequenceMatcher and the
+    banded alignment, returning seconds and the number of correct and wrong matches.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for size in sizes:
+        words, times, transcribed, transcribed_times, truth = _synthetic_lyrics(
+            size, rng
+        )
+
+        aligners = {
+            "sequence_matcher": lambda: SequenceMatcher(
+                None, words, transcribed
+            ).get_matching_blocks(),
+            "banded": lambda: banded_alignment(
+                words, transcribed, times, transcribed_times, band_width=band_width
+            ),
+        }
+
+        results[size] = {}
+        for name, align in aligners.items():
+            started_at = time.perf_counter()
+            blocks = align()
+            seconds = time.perf_counter() - started_at
+
+            pairs = {
+                (block.a + k, block.b + k)
+                for block in blocks
+                for k in range(block.size)
+            }
+            results[size][name] = {
+                "seconds": seconds,
+                "correct": len(pairs & truth),
+                "wrong": len(pairs - truth),
+                "expected": len(truth),
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    for size, result in benchmark_alignment().items():
+        for name, measurements in result.items():
+            print(
+                f"{size} words, {name}: {measurements['seconds']:.3f}s, "
+                f"{measurements['correct']}/{measurements['expected']} correct, "
+                f"{measurements['wrong']} wrong"
+            )
@@ -5,13 +5,18 @@ import re
 
 from cover import download_cover
 from lyrics import (
-    merge_lyrics,
+    repair_timings,
     WhisperLyricsExtractor,
-    SpotifyLyricsExtractor,
     Lyrics,
+    load_lyrics,
+    save_lyrics,
 )
-from separation import separate_vocals
-from video import VideoGenerator
+from resolver import resolve_lyrics
+
+# separation (demucs) and video (moviepy) are imported by the stages that need them,
+# so that --help and fully cached runs start without loading them
+
+ML_MODULES = ("torch", "whisper", "whisperx", "demucs", "faster_whisper", "ctranslate2")
 
 
 def slugify(s):
@@ -30,6 +35,11 @@ def parse_args():
 
     parser.add_argument("-n", "--name", type=str)
     parser.add_argument("-a", "--artist", type=str)
+    parser.add_argument(
+        "--export-json",
+        action="store_true",
+        help="also write the extracted lyrics as JSON for debugging",
+    )
 
     return parser.parse_args()
 
@@ -66,6 +76,7 @@ def main():
         os.path.exists(f"{output_path}/vocals.wav")
         and os.path.exists(f"{output_path}/no_vocals.wav")
     ):
+        from separation import separate_vocals
 
         vocals_path, no_vocals_path = separate_vocals(song_path, output_path)
         print(f"Vocals saved to {vocals_path}, no vocals saved to {no_vocals_path}")
@@ -80,53 +91,37 @@ def main():
     if not cache or not os.path.exists(f"{output_path}/lyrics.json"):
         print("Extracting lyrics")
 
-        if not cache or not os.path.exists(f"{output_path}/lyrics_spotify.json"):
-            try:
-                spotify_lyrics = SpotifyLyricsExtractor().extract(
-                    song_query, vocals_path
-                )
-                with open(f"{output_path}/lyrics_spotify.json", "w") as f:
-                    json.dump(spotify_lyrics.to_dict(), f, indent=4)
-            except:
-                spotify_lyrics = None
-
-        else:
-            with open(f"{output_path}/lyrics_spotify.json", "r") as f:
-                spotify_lyrics = Lyrics.from_dict(json.load(f))
-
-            print("Loaded Spotify lyrics from cache")
-
-        if not cache or not os.path.exists(f"{output_path}/lyrics_whisper.json"):
+        if not cache or not os.path.exists(f"{output_path}/lyrics_resolved.lyrics"):
             try:
-                whisper_lyrics = WhisperLyricsExtractor().extract(
-                    song_query, vocals_path
+                # whisper only runs if no provider has synced lyrics within the budget
+                _, resolved_lyrics = resolve_lyrics(
+                    song_query,
+                    vocals_path,
+                    fallback=lambda name, audio_file: WhisperLyricsExtractor(
+                        cache_dir=output_path
+                    ).extract(name, audio_file),
                 )
-                with open(f"{output_path}/lyrics_whisper.json", "w") as f:
-                    json.dump(whisper_lyrics.to_dict(), f, indent=4)
+                save_lyrics(resolved_lyrics, f"{output_path}/lyrics_resolved.lyrics")
+                if args.export_json:
+                    save_lyrics(resolved_lyrics, f"{output_path}/lyrics_resolved.json")
             except Exception as e:
                 print(e)
-                whisper_lyrics = None
+                resolved_lyrics = None
 
         else:
-            with open(f"{output_path}/lyrics_whisper.json", "r") as f:
-                whisper_lyrics = Lyrics.from_dict(json.load(f))
+            resolved_lyrics = load_lyrics(f"{output_path}/lyrics_resolved.lyrics")
 
-            print("Loaded Whisper lyrics from cache")
+            print("Loaded lyrics from cache")
 
         return
 
         merged_lyrics = {}
 
-        if not spotify_lyrics:
-            print("No lyrics found on Spotify")
-            merged_lyrics = whisper_lyrics
-
-        if not whisper_lyrics:
-            print("No lyrics found on Whisper")
-            merged_lyrics = spotify_lyrics
+        if not resolved_lyrics:
+            print("No lyrics found")
 
-        if spotify_lyrics and whisper_lyrics:
-            merged_lyrics = merge_lyrics(spotify_lyrics, whisper_lyrics)
+        else:
+            merged_lyrics = repair_timings(resolved_lyrics)
 
         with open(f"{output_path}/lyrics.json", "w") as f:
             pass
@@ -137,6 +132,8 @@ def main():
         merged_lyrics = Lyrics.from_dict(json.load(open(f"{output_path}/lyrics.json")))
 
     print("Generating video")
+    from video import VideoGenerator
+
     video_path = VideoGenerator(bg_blur=100).generate(
         merged_lyrics,
         song_path,
@@ -148,5 +145,36 @@ def main():
     print(f"Video saved to {video_path}")
 
 
+def benchmark_startup(output_path="fixtures"):
+    """
+    Time a fresh interpreter importing app and loading cached lyrics, like a fully cached run
+    does before the video stage, and assert that none of the ML stacks were imported.
+    """
+    import subprocess
+    import sys
+    import time
+
+    code = (
+        "import sys, app\n"
+        f"app.Lyrics.from_dict(app.json.load(open({output_path + '/merged_lyrics.json'!r})))\n"
+        "print(','.join(m for m in app.ML_MODULES if m in sys.modules))"
+    )
+
+    started_at = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds = time.perf_counter() - started_at
+
+    imported = [m for m in result.stdout.strip().split(",") if m]
+    assert not imported, f"cached run imported {', '.join(imported)}"
+
+    return seconds
+
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,18 @@
+import contextlib
+import multiprocessing
+import time
 import warnings
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import torch
@@ -11,12 +24,19 @@ from whisper.audio import (
     N_SAMPLES,
     SAMPLE_RATE,
     CHUNK_LENGTH,
+    TOKENS_PER_SECOND,
     log_mel_spectrogram,
     pad_or_trim,
     load_audio,
 )
-from whisper.decoding import DecodingOptions, DecodingResult
-from whisper.timing import add_word_timestamps
+from whisper.decoding import DecodingOptions, DecodingResult, DecodingTask, LogitFilter
+from whisper.timing import (
+    WordTiming,
+    add_word_timestamps,
+    backtrace,
+    median_filter,
+    merge_punctuations,
+)
 from whisper.tokenizer import LANGUAGES, get_tokenizer
 from whisper.utils import (
     exact_div,
@@ -27,10 +47,400 @@ from whisper.utils import (
 if TYPE_CHECKING:
     from whisper.model import Whisper
 
+try:
+    from whisper.model import disable_sdpa
+except ImportError:  # older whisper versions always return the attention weights
+    disable_sdpa = contextlib.nullcontext
+
+from whisperx import align
 from whisperx.vad import merge_chunks
 
 
-def transcribe(
+class VocabularyBias(LogitFilter):
+    """
+    Adds a constant bias to the logits of all tokens that spell one of the given words,
+    so the decoder prefers the vocabulary of the expected lyrics.
+    """
+
+    def __init__(self, tokenizer, words: Iterable[str], bias: float = 1.0):
+        token_ids = set()
+        for word in words:
+            word = word.strip()
+            if not word:
+                continue
+            token_ids.update(tokenizer.encode(word))
+            token_ids.update(tokenizer.encode(" " + word))
+
+        self.token_ids = sorted(token for token in token_ids if token < tokenizer.eot)
+        self.bias = bias
+
+    def apply(self, logits: torch.Tensor, tokens: torch.Tensor):
+        if self.token_ids:
+            logits[:, self.token_ids] += self.bias
+
+
+class SpeculativeDecodingTask(DecodingTask):
+    """
+    Greedy decoding where a small draft model proposes `num_draft_tokens` tokens at a time and
+    the target model verifies all of them in a single forward pass. Every emitted token is the
+    argmax of the target model's filtered logits, so the output matches plain greedy decoding
+    with the target model.
+    """
+
+    def __init__(
+        self,
+        model: "Whisper",
+        options: DecodingOptions,
+        draft_model: "Whisper",
+        num_draft_tokens: int = 4,
+    ):
+        if options.temperature != 0 or options.beam_size or options.best_of:
+            raise ValueError("Speculative decoding only supports greedy decoding")
+        if draft_model.dims.n_vocab != model.dims.n_vocab:
+            raise ValueError("Draft and target model need to share the vocabulary")
+
+        super().__init__(model, options)
+        self.draft_model = draft_model
+        self.num_draft_tokens = num_draft_tokens
+        self.draft_audio_features = None
+
+    @torch.no_grad()
+    def run(self, mel: torch.Tensor):
+        if mel.shape[-2:] == (
+            self.model.dims.n_audio_ctx,
+            self.model.dims.n_audio_state,
+        ):
+            raise ValueError("Speculative decoding needs the mel spectrogram as input")
+
+        self.draft_audio_features = self.draft_model.encoder(
+            mel.half() if self.options.fp16 else mel
+        )
+        return super().run(mel)
+
+    @staticmethod
+    def _truncate_cache(model: "Whisper", cache: dict, length: int):
+        # only the self attention caches grow with the tokens, cross attention stays as is
+        for block in model.decoder.blocks:
+            for module in (block.attn.key, block.attn.value):
+                if module in cache:
+                    cache[module] = cache[module][:, :length]
+
+    def _propose(self, tokens: torch.Tensor, cache: dict, fed: int, n: int):
+        """Greedily propose n tokens with the draft model, returns them and the new cache length"""
+        proposed = []
+        for _ in range(n):
+            logits = self.draft_model.decoder(
+                tokens[:, fed:], self.draft_audio_features, kv_cache=cache
+            )[:, -1]
+            fed = tokens.shape[-1]
+
+            for logit_filter in self.logit_filters:
+                logit_filter.apply(logits, tokens)
+
+            next_token = logits.argmax(dim=-1)
+            proposed.append(next_token.item())
+            tokens = torch.cat([tokens, next_token[:, None]], dim=-1)
+
+            if next_token.item() == self.tokenizer.eot:
+                break
+
+        return proposed, fed
+
+    def _main_loop(self, audio_features: torch.Tensor, tokens: torch.Tensor):
+        assert tokens.shape[0] == 1, "speculative decoding runs on a single sequence"
+
+        sum_logprobs = torch.zeros(1, device=audio_features.device)
+        no_speech_probs = [np.nan]
+
+        cache, hooks = self.model.install_kv_cache_hooks()
+        draft_cache, draft_hooks = self.draft_model.install_kv_cache_hooks()
+        fed, draft_fed = 0, 0
+        sampled = 0
+        completed = False
+
+        try:
+            while not completed:
+                n_draft = min(
+                    self.num_draft_tokens,
+                    self.sample_len - sampled - 1,
+                    self.n_ctx - tokens.shape[-1],
+                )
+                proposed, draft_fed = (
+                    self._propose(tokens, draft_cache, draft_fed, n_draft)
+                    if n_draft > 0
+                    else ([], draft_fed)
+                )
+
+                # one forward pass over the unseen tokens and all proposals
+                n_tokens = tokens.shape[-1]
+                inputs = torch.cat(
+                    [tokens[:, fed:], torch.tensor([proposed], dtype=tokens.dtype)],
+                    dim=-1,
+                ).to(tokens.device)
+                logits = self.model.decoder(inputs, audio_features, kv_cache=cache)
+
+                if fed == 0 and self.tokenizer.no_speech is not None:
+                    probs_at_sot = logits[:, self.sot_index].float().softmax(dim=-1)
+                    no_speech_probs = probs_at_sot[:, self.tokenizer.no_speech].tolist()
+
+                accepted = 0
+                for j in range(len(proposed) + 1):
+                    # logits predicting the token after tokens[:, : n_tokens + j]
+                    next_logits = logits[:, n_tokens - 1 - fed + j]
+                    for logit_filter in self.logit_filters:
+                        logit_filter.apply(next_logits, tokens)
+
+                    tokens, completed = self.decoder.update(
+                        tokens, next_logits, sum_logprobs
+                    )
+                    sampled += 1
+
+                    if completed or tokens.shape[-1] > self.n_ctx:
+                        completed = True
+                    if sampled >= self.sample_len:
+                        completed = True
+
+                    if (
+                        completed
+                        or j == len(proposed)
+                        or tokens[0, -1].item() != proposed[j]
+                    ):
+                        break
+                    accepted += 1
+
+                # keep only the cache entries of tokens that were actually accepted
+                fed = n_tokens + accepted
+                draft_fed = min(draft_fed, n_tokens + accepted)
+                self._truncate_cache(self.model, cache, fed)
+                self._truncate_cache(self.draft_model, draft_cache, draft_fed)
+        finally:
+            for hook in hooks + draft_hooks:
+                hook.remove()
+
+        return tokens, sum_logprobs, no_speech_probs
+
+
+def dtw_batched(matrices: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Dynamic time warping over several cost matrices at once. The matrices are padded to the same
+    shape and all of them are swept together one anti-diagonal at a time, with the same tie
+    breaking as `whisper.timing.dtw`.
+    """
+    n_rows = max(x.shape[0] for x in matrices)
+    n_cols = max(x.shape[1] for x in matrices)
+
+    x = np.full((len(matrices), n_rows, n_cols), np.inf)
+    for b, matrix in enumerate(matrices):
+        x[b, : matrix.shape[0], : matrix.shape[1]] = matrix
+
+    cost = np.full((len(matrices), n_rows + 1, n_cols + 1), np.inf, dtype=np.float32)
+    cost[:, 0, 0] = 0
+    trace = -np.ones((len(matrices), n_rows + 1, n_cols + 1), dtype=np.float32)
+
+    for diagonal in range(2, n_rows + n_cols + 1):
+        i = np.arange(max(1, diagonal - n_cols), min(n_rows, diagonal - 1) + 1)
+        j = diagonal - i
+
+        c0 = cost[:, i - 1, j - 1]
+        c1 = cost[:, i - 1, j]
+        c2 = cost[:, i, j - 1]
+
+        t = np.full(c0.shape, 2, dtype=np.int8)
+        t[(c1 < c0) & (c1 < c2)] = 1
+        t[(c0 < c1) & (c0 < c2)] = 0
+
+        cost[:, i, j] = x[:, i - 1, j - 1] + np.where(
+            t == 0, c0, np.where(t == 1, c1, c2)
+        )
+        trace[:, i, j] = t
+
+    return [
+        backtrace(trace[b, : matrix.shape[0] + 1, : matrix.shape[1] + 1].copy())
+        for b, matrix in enumerate(matrices)
+    ]
+
+
+def find_alignments(
+    model: "Whisper",
+    tokenizer,
+    text_tokens_per_window: List[List[int]],
+    mels: torch.Tensor,
+    num_frames_per_window: List[int],
+    *,
+    medfilt_width: int = 7,
+    qk_scale: float = 1.0,
+) -> List[List[WordTiming]]:
+    """
+    Batched version of `whisper.timing.find_alignment`: the cross-attention of all windows is
+    collected in a single forward pass and the DTW runs over all windows together.
+    """
+    prefix = [*tokenizer.sot_sequence, tokenizer.no_timestamps]
+    sequences = [
+        prefix + text_tokens + [tokenizer.eot] for text_tokens in text_tokens_per_window
+    ]
+    max_length = max(len(sequence) for sequence in sequences)
+
+    # the decoder is causal, so padding at the end does not change the real positions
+    tokens = torch.tensor(
+        [
+            sequence + [tokenizer.eot] * (max_length - len(sequence))
+            for sequence in sequences
+        ]
+    ).to(model.device)
+
+    # install hooks on the cross attention layers to retrieve the attention weights
+    QKs = [None] * model.dims.n_text_layer
+    hooks = [
+        block.cross_attn.register_forward_hook(
+            lambda _, ins, outs, index=i: QKs.__setitem__(index, outs[-1])
+        )
+        for i, block in enumerate(model.decoder.blocks)
+    ]
+
+    with torch.no_grad(), disable_sdpa():
+        logits = model(mels, tokens)
+        token_probs = logits[:, len(tokenizer.sot_sequence) :, : tokenizer.eot].softmax(
+            dim=-1
+        )
+
+    for hook in hooks:
+        hook.remove()
+
+    matrices = []
+    for b, (sequence, num_frames) in enumerate(zip(sequences, num_frames_per_window)):
+        # heads * tokens * frames
+        weights = torch.stack(
+            [QKs[_l][b, _h] for _l, _h in model.alignment_heads.indices().T]
+        )
+        weights = weights[:, : len(sequence), : num_frames // 2]
+        weights = (weights * qk_scale).softmax(dim=-1)
+        std, mean = torch.std_mean(weights, dim=-2, keepdim=True, unbiased=False)
+        weights = (weights - mean) / std
+        weights = median_filter(weights, medfilt_width)
+
+        matrix = weights.mean(axis=0)
+        matrix = matrix[len(tokenizer.sot_sequence) : -1]
+        matrices.append(-matrix.double().cpu().numpy())
+
+    paths = dtw_batched(matrices)
+
+    alignments = []
+    for b, (text_tokens, (text_indices, time_indices)) in enumerate(
+        zip(text_tokens_per_window, paths)
+    ):
+        words, word_tokens = tokenizer.split_to_word_tokens(
+            text_tokens + [tokenizer.eot]
+        )
+        if len(text_tokens) == 0 or len(word_tokens) <= 1:
+            alignments.append([])
+            continue
+
+        text_token_probs = token_probs[b, np.arange(len(text_tokens)), text_tokens]
+        text_token_probs = text_token_probs.tolist()
+
+        word_boundaries = np.pad(np.cumsum([len(t) for t in word_tokens[:-1]]), (1, 0))
+        jumps = np.pad(np.diff(text_indices), (1, 0), constant_values=1).astype(bool)
+        jump_times = time_indices[jumps] / TOKENS_PER_SECOND
+        start_times = jump_times[word_boundaries[:-1]]
+        end_times = jump_times[word_boundaries[1:]]
+        word_probabilities = [
+            np.mean(text_token_probs[i:j])
+            for i, j in zip(word_boundaries[:-1], word_boundaries[1:])
+        ]
+
+        alignments.append(
+            [
+                WordTiming(word, tokens, start, end, probability)
+                for word, tokens, start, end, probability in zip(
+                    words, word_tokens, start_times, end_times, word_probabilities
+                )
+            ]
+        )
+
+    return alignments
+
+
+def add_word_timestamps_batched(
+    *,
+    windows: List[Tuple[List[dict], torch.Tensor, int]],
+    model: "Whisper",
+    tokenizer,
+    prepend_punctuations: str = "\"'“¿([{-",
+    append_punctuations: str = "\"'.。,，!！?？:：”)]}、",
+    **kwargs,
+):
+    """
+    Add word timestamps to the segments of several windows at once, given as tuples of the
+    window's segments, its mel spectrogram and its number of frames.
+    """
+    for segments, _, _ in windows:
+        for segment in segments:
+            segment["words"] = []
+
+    # windows without any text have nothing to align
+    windows = [
+        window
+        for window in windows
+        if any(token < tokenizer.eot for s in window[0] for token in s["tokens"])
+    ]
+    if not windows:
+        return
+
+    text_tokens_per_segment = [
+        [
+            [token for token in segment["tokens"] if token < tokenizer.eot]
+            for segment in segments
+        ]
+        for segments, _, _ in windows
+    ]
+    alignments = find_alignments(
+        model,
+        tokenizer,
+        [
+            [t for tokens in window for t in tokens]
+            for window in text_tokens_per_segment
+        ],
+        torch.stack([mel for _, mel, _ in windows]),
+        [num_frames for _, _, num_frames in windows],
+        **kwargs,
+    )
+
+    for (segments, _, _), segment_tokens, alignment in zip(
+        windows, text_tokens_per_segment, alignments
+    ):
+        merge_punctuations(alignment, prepend_punctuations, append_punctuations)
+
+        time_offset = segments[0]["seek"] * HOP_LENGTH / SAMPLE_RATE
+        word_index = 0
+
+        for segment, text_tokens in zip(segments, segment_tokens):
+            saved_tokens = 0
+            words = []
+
+            while word_index < len(alignment) and saved_tokens < len(text_tokens):
+                timing = alignment[word_index]
+
+                if timing.word:
+                    words.append(
+                        dict(
+                            word=timing.word,
+                            start=round(time_offset + timing.start, 2),
+                            end=round(time_offset + timing.end, 2),
+                            probability=timing.probability,
+                        )
+                    )
+
+                saved_tokens += len(timing.tokens)
+                word_index += 1
+
+            if words:
+                segment["start"] = words[0]["start"]
+                segment["end"] = words[-1]["end"]
+
+            segment["words"] = words
+
+
+def iter_transcribe(
     model: "Whisper",
     audio: Union[str, np.ndarray, torch.Tensor] = None,
     mel: np.ndarray = None,
@@ -45,10 +455,17 @@ def transcribe(
     word_timestamps: bool = False,
     prepend_punctuations: str = "\"'“¿([{-",
     append_punctuations: str = "\"'.。,，!！?？:：”)]}、",
+    window_prompt: Optional[Callable[[float, float], Optional[str]]] = None,
+    bias_words: Optional[Iterable[str]] = None,
+    bias_strength: float = 1.0,
+    draft_model: Optional["Whisper"] = None,
+    num_draft_tokens: int = 4,
+    word_timestamps_batch_size: int = 1,
     **decode_options,
 ):
     """
-    Transcribe an audio file using Whisper.
+    Transcribe an audio file using Whisper, yielding the segments of every window as soon as the
+    window is decoded (including their "words" if `word_timestamps` is True).
     We redefine the Whisper transcribe function to allow mel input (for sequential slicing of audio)
 
     Parameters
@@ -92,6 +509,11 @@ def transcribe(
         Extract word-level timestamps using the cross-attention pattern and dynamic time warping,
         and include the timestamps for each word in each segment.
 
+    word_timestamps_batch_size: int
+        If larger than 1, the word timestamps of this many windows are computed together in one
+        forward pass and one batched DTW. The next window then starts after the last timestamp
+        token instead of after the last word.
+
     prepend_punctuations: str
         If word_timestamps is True, merge these punctuation symbols with the next word
 
@@ -103,13 +525,35 @@ def transcribe(
         "prompt-engineer" a context for transcription, e.g. custom vocabularies or proper nouns
         to make it more likely to predict those word correctly.
 
+    window_prompt: Optional[Callable[[float, float], Optional[str]]]
+        Optional callback returning the expected text for the window between the given start and
+        end time (in seconds). The text is appended to the prompt of that window, e.g. to condition
+        decoding on lyrics that are already known from a provider.
+
+    bias_words: Optional[Iterable[str]]
+        Optional vocabulary whose tokens get `bias_strength` added to their logits while decoding.
+
+    bias_strength: float
+        Logit bias applied to the tokens of `bias_words`
+
+    draft_model: Optional[Whisper]
+        Optional smaller Whisper model sharing the vocabulary of `model`. Greedy decodes are then
+        sped up by speculative decoding: the draft model proposes `num_draft_tokens` tokens which
+        the target model verifies in one forward pass. The output is the same as without it.
+
+    num_draft_tokens: int
+        Number of tokens proposed by the draft model per verification step
+
     decode_options: dict
         Keyword arguments to construct `DecodingOptions` instances
 
     Returns
     -------
-    A dictionary containing the resulting text ("text") and segment-level details ("segments"), and
-    the spoken language ("language"), which is detected when `decode_options["language"]` is None.
+    A generator of segment dictionaries. When exhausted, it returns (as `StopIteration.value`)
+    a dictionary containing the resulting text ("text") and segment-level details ("segments"), the
+    spoken language ("language"), which is detected when `decode_options["language"]` is None,
+    the number of decodes that had to be repeated at a higher temperature ("fallbacks") and the
+    windows skipped as silence ("skipped", with their "seek", "end_seek" and "no_speech_prob").
     """
     dtype = torch.float16 if decode_options.get("fp16", True) else torch.float32
     if model.device == torch.device("cpu"):
@@ -154,13 +598,48 @@ def transcribe(
     if word_timestamps and task == "translate":
         warnings.warn("Word-level timestamps on translations may not be reliable.")
 
+    vocabulary_bias = (
+        VocabularyBias(tokenizer, bias_words, bias_strength)
+        if bias_words is not None
+        else None
+    )
+    fallbacks = 0
+
+    def decode(segment: torch.Tensor, options: DecodingOptions) -> DecodingResult:
+        speculative = (
+            draft_model is not None
+            and options.temperature == 0
+            and not options.beam_size
+            and not options.best_of
+        )
+        if vocabulary_bias is None and not speculative:
+            return model.decode(segment, options)
+
+        if speculative:
+            task = SpeculativeDecodingTask(
+                model, options, draft_model, num_draft_tokens
+            )
+        else:
+            task = DecodingTask(model, options)
+
+        if vocabulary_bias is not None:
+            # bias before the timestamp rules, which compare text and timestamp probabilities
+            task.logit_filters.insert(0, vocabulary_bias)
+
+        return task.run(segment.unsqueeze(0))[0]
+
     def decode_with_fallback(segment: torch.Tensor) -> DecodingResult:
+        nonlocal fallbacks
+
         temperatures = (
             [temperature] if isinstance(temperature, (int, float)) else temperature
         )
         decode_result = None
 
-        for t in temperatures:
+        for i, t in enumerate(temperatures):
+            if i > 0:
+                fallbacks += 1
+
             kwargs = {**decode_options}
             if t > 0:
                 # disable beam_size and patience when t > 0
@@ -171,7 +650,7 @@ def transcribe(
                 kwargs.pop("best_of", None)
 
             options = DecodingOptions(**kwargs, temperature=t)
-            decode_result = model.decode(segment, options)
+            decode_result = decode(segment, options)
 
             needs_fallback = False
             if (
@@ -200,6 +679,8 @@ def transcribe(
     all_tokens = []
     all_segments = []
     prompt_reset_since = 0
+    pending_windows = []
+    skipped_windows = []
 
     if initial_prompt is not None:
         initial_prompt_tokens = tokenizer.encode(" " + initial_prompt.strip())
@@ -236,6 +717,14 @@ def transcribe(
             mel_segment = pad_or_trim(mel_segment, N_FRAMES).to(model.device).to(dtype)
 
             decode_options["prompt"] = all_tokens[prompt_reset_since:]
+            if window_prompt is not None:
+                expected_text = window_prompt(
+                    time_offset, time_offset + segment_duration
+                )
+                if expected_text:
+                    decode_options["prompt"] = decode_options["prompt"] + (
+                        tokenizer.encode(" " + expected_text.strip())
+                    )
             result: DecodingResult = decode_with_fallback(mel_segment)
             tokens = torch.tensor(result.tokens)
             if no_speech_threshold is not None:
@@ -249,6 +738,13 @@ def transcribe(
                     should_skip = False
 
                 if should_skip:
+                    skipped_windows.append(
+                        {
+                            "seek": seek,
+                            "end_seek": seek + segment_size,
+                            "no_speech_prob": result.no_speech_prob,
+                        }
+                    )
                     seek += segment_size  # fast-forward to the next segment boundary
                     continue
 
@@ -321,7 +817,7 @@ def transcribe(
                 # do not feed the prompt tokens if a high temperature was used
                 prompt_reset_since = len(all_tokens)
 
-            if word_timestamps:
+            if word_timestamps and word_timestamps_batch_size == 1:
                 add_word_timestamps(
                     segments=current_segments,
                     model=model,
@@ -354,14 +850,11 @@ def transcribe(
                     segment["tokens"] = []
                     segment["words"] = []
 
-            all_segments.extend(
-                [
-                    {"id": i, **segment}
-                    for i, segment in enumerate(
-                        current_segments, start=len(all_segments)
-                    )
-                ]
-            )
+            current_segments = [
+                {"id": i, **segment}
+                for i, segment in enumerate(current_segments, start=len(all_segments))
+            ]
+            all_segments.extend(current_segments)
             all_tokens.extend(
                 [token for segment in current_segments for token in segment["tokens"]]
             )
@@ -369,10 +862,313 @@ def transcribe(
             # update progress bar
             pbar.update(min(content_frames, seek) - previous_seek)
 
+            if not word_timestamps or word_timestamps_batch_size == 1:
+                yield from current_segments
+                continue
+
+            pending_windows.append((current_segments, mel_segment, segment_size))
+            if len(pending_windows) >= word_timestamps_batch_size:
+                add_word_timestamps_batched(
+                    windows=pending_windows,
+                    model=model,
+                    tokenizer=tokenizer,
+                    prepend_punctuations=prepend_punctuations,
+                    append_punctuations=append_punctuations,
+                )
+                for segments, _, _ in pending_windows:
+                    yield from segments
+                pending_windows = []
+
+        if pending_windows:
+            add_word_timestamps_batched(
+                windows=pending_windows,
+                model=model,
+                tokenizer=tokenizer,
+                prepend_punctuations=prepend_punctuations,
+                append_punctuations=append_punctuations,
+            )
+            for segments, _, _ in pending_windows:
+                yield from segments
+
     return dict(
         text=tokenizer.decode(all_tokens[len(initial_prompt_tokens) :]),
         segments=all_segments,
         language=language,
+        fallbacks=fallbacks,
+        skipped=skipped_windows,
+    )
+
+
+def transcribe(
+    model: "Whisper",
+    audio: Union[str, np.ndarray, torch.Tensor] = None,
+    mel: np.ndarray = None,
+    **kwargs,
+):
+    """
+    Transcribe an audio file using Whisper, see `iter_transcribe` for the parameters.
+
+    Returns
+    -------
+    A dictionary containing the resulting text ("text") and segment-level details ("segments"), the
+    spoken language ("language"), the number of fallback decodes ("fallbacks") and the windows
+    skipped as silence ("skipped").
+    """
+    segments = iter_transcribe(model, audio, mel, **kwargs)
+    while True:
+        try:
+            next(segments)
+        except StopIteration as stop:
+            return stop.value
+
+
+def detect_language_from_vocals(
+    model: "Whisper",
+    audio: Union[np.ndarray, torch.Tensor],
+    num_windows: int = 3,
+) -> Tuple[str, dict]:
+    """
+    Detect the language of a track once, from the 30-second windows with the most energy in the
+    (vocal) audio instead of the first 30 seconds, which are often an instrumental intro.
+    The language probabilities of the windows are averaged.
+    """
+    if not model.is_multilingual:
+        return "en", {"en": 1.0}
+
+    if not torch.is_tensor(audio):
+        audio = torch.from_numpy(audio)
+
+    num_audio_windows = max(1, -(-len(audio) // N_SAMPLES))
+    windows = torch.nn.functional.pad(
+        audio, (0, num_audio_windows * N_SAMPLES - len(audio))
+    ).reshape(num_audio_windows, N_SAMPLES)
+
+    energy = windows.pow(2).mean(dim=-1)
+    indices = torch.topk(energy, min(num_windows, num_audio_windows)).indices
+
+    mel = torch.stack(
+        [pad_or_trim(log_mel_spectrogram(windows[i]), N_FRAMES) for i in indices]
+    )
+    _, probs = model.detect_language(mel.to(model.device))
+
+    averaged = {
+        language: sum(window_probs[language] for window_probs in probs) / len(probs)
+        for language in probs[0]
+    }
+    return max(averaged, key=averaged.get), averaged
+
+
+def _best_lag(source: torch.Tensor, target: torch.Tensor, max_lag: int):
+    """
+    Lag (in frames) at which the target envelope correlates best with the source envelope,
+    together with that correlation.
+    """
+    source = (source - source.mean()) / (source.std() + 1e-8)
+    target = (target - target.mean()) / (target.std() + 1e-8)
+
+    best_lag, best_correlation = 0, -1.0
+    for lag in range(-max_lag, max_lag + 1):
+        a = source[: len(source) - lag] if lag >= 0 else source[-lag:]
+        b = target[lag:] if lag >= 0 else target[: len(target) + lag]
+        n = min(len(a), len(b))
+        if n == 0:
+            continue
+
+        correlation = float(a[:n] @ b[:n]) / n
+        if correlation > best_correlation:
+            best_lag, best_correlation = lag, correlation
+
+    return best_lag, best_correlation
+
+
+def find_repeated_sections(
+    audio: torch.Tensor,
+    segments: list,
+    similarity_threshold: float = 0.9,
+    alignment_threshold: float = 0.8,
+    max_lag: float = 0.5,
+    feature_hop: float = 0.25,
+) -> dict:
+    """
+    Find VAD chunks that repeat earlier audio (e.g. a chorus) with the self-similarity matrix of
+    the log-mel frames of the whole song, so that a repetition is found wherever it starts and not
+    only when the VAD happened to cut both occurrences into matching chunks. A chunk repeats the
+    audio `offset` seconds before it if the frames along that diagonal of the matrix are similar
+    on average; the offset is then refined by cross-correlating the energy envelopes within
+    `max_lag` seconds. The earlier occurrence has to lie within chunks that are not repeats
+    themselves, because their transcription is transplanted.
+
+    Returns a dictionary mapping the index of a repeated chunk to the offset (in seconds) of its
+    earlier occurrence.
+    """
+    mel = log_mel_spectrogram(audio)
+    envelope = mel.mean(dim=0)
+
+    # pool the frames to feature_hop seconds and normalize them for cosine similarity
+    hop = max(int(feature_hop * FRAMES_PER_SECOND), 1)
+    n_features = mel.shape[-1] // hop
+    if n_features == 0:
+        return {}
+    features = (
+        mel[:, : n_features * hop].reshape(mel.shape[0], n_features, hop).mean(-1).T
+    )
+    features = features - features.mean(dim=1, keepdim=True)
+    features = features / (features.norm(dim=1, keepdim=True) + 1e-8)
+    similarity = features @ features.T
+
+    repeats = {}
+    for j, segment in enumerate(segments):
+        start = int(segment["start"] * FRAMES_PER_SECOND / hop)
+        end = min(int(segment["end"] * FRAMES_PER_SECOND / hop), n_features)
+        if end - start < 1 or start < end - start:
+            continue
+
+        # mean similarity of the chunk with the audio lags frames before it, for every lag
+        # such that the earlier occurrence ends before the chunk starts
+        lags = torch.arange(end - start, start + 1)
+        columns = torch.arange(start, end)
+        scores = similarity[columns[None] - lags[:, None], columns[None]].mean(dim=1)
+
+        for k in torch.argsort(scores, descending=True).tolist():
+            if scores[k] < similarity_threshold:
+                break
+
+            offset = lags[k].item() * hop / FRAMES_PER_SECOND
+            source_start = segment["start"] - offset
+            source_end = segment["end"] - offset
+            overlapping = [
+                i
+                for i, source in enumerate(segments[:j])
+                if source["start"] < source_end and source["end"] > source_start
+            ]
+            if not overlapping or any(i in repeats for i in overlapping):
+                continue
+
+            target = slice(
+                int(segment["start"] * FRAMES_PER_SECOND),
+                int(segment["end"] * FRAMES_PER_SECOND),
+            )
+            source = slice(
+                int(source_start * FRAMES_PER_SECOND),
+                int(source_end * FRAMES_PER_SECOND),
+            )
+            lag, correlation = _best_lag(
+                envelope[source], envelope[target], int(max_lag * FRAMES_PER_SECOND)
+            )
+            if correlation < alignment_threshold:
+                continue
+
+            repeats[j] = offset + lag / FRAMES_PER_SECOND
+            break
+
+    return repeats
+
+
+def _chunk_output(chunk: dict, result: dict) -> dict:
+    return {
+        "start": chunk["start"],
+        "end": chunk["end"],
+        "language": result["language"],
+        "text": result["text"],
+        "seg-text": [x["text"] for x in result["segments"]],
+        "seg-start": [x["start"] for x in result["segments"]],
+        "seg-end": [x["end"] for x in result["segments"]],
+    }
+
+
+def _transplant(chunk: dict, decoded: list, offset: float) -> dict:
+    """
+    Output of the VAD chunk built from the decoded segments of the audio `offset` seconds before
+    it, with their timings shifted into the chunk.
+    """
+    duration = chunk["end"] - chunk["start"]
+    source_start = chunk["start"] - offset
+    source_end = chunk["end"] - offset
+
+    texts, starts, ends = [], [], []
+    for source in decoded:
+        for text, start, end in zip(
+            source["seg-text"], source["seg-start"], source["seg-end"]
+        ):
+            start += source["start"]
+            end += source["start"]
+            if not source_start <= (start + end) / 2 < source_end:
+                continue
+
+            texts.append(text)
+            starts.append(min(max(start - source_start, 0.0), duration))
+            ends.append(min(max(end - source_start, 0.0), duration))
+
+    return {
+        "start": chunk["start"],
+        "end": chunk["end"],
+        "language": decoded[0]["language"],
+        "text": "".join(texts),
+        "seg-text": texts,
+        "seg-start": starts,
+        "seg-end": ends,
+        "reused-from": source_start,
+    }
+
+
+def _verify_transplant(
+    audio: torch.Tensor,
+    output: dict,
+    offset: float,
+    alignment_threshold: float = 0.8,
+    max_lag: float = 0.1,
+) -> bool:
+    """
+    Check a transplanted chunk segment by segment: the energy envelope under every transplanted
+    segment has to correlate with the envelope of the segment it was copied from. Segments
+    shorter than `max_lag` are too short to correlate; a chunk with none that is long enough
+    fails, so that it is decoded instead.
+    """
+    verified = 0
+
+    for start, end in zip(output["seg-start"], output["seg-end"]):
+        start += output["start"]
+        end += output["start"]
+        if end - start < max_lag:
+            continue
+
+        envelopes = [
+            log_mel_spectrogram(
+                audio[int(t0 * SAMPLE_RATE) : int(t1 * SAMPLE_RATE)]
+            ).mean(dim=0)
+            for t0, t1 in ((start - offset, end - offset), (start, end))
+        ]
+        _, correlation = _best_lag(*envelopes, int(max_lag * FRAMES_PER_SECOND))
+        if correlation < alignment_threshold:
+            return False
+        verified += 1
+
+    return verified > 0
+
+
+# model, audio and options shared with forked workers, see transcribe_with_vad
+_worker_state = {}
+
+
+def _init_worker(num_threads: int):
+    torch.set_num_threads(num_threads)
+
+
+def _transcribe_chunk(start: float, end: float):
+    model = _worker_state["model"]
+    audio = _worker_state["audio"]
+    verbose = _worker_state["verbose"]
+
+    if verbose:
+        print(
+            f"~~ Transcribing VAD chunk: ({format_timestamp(start)} --> {format_timestamp(end)}) ~~"
+        )
+
+    seg_audio = audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)]
+    local_mel = log_mel_spectrogram(seg_audio, padding=N_SAMPLES)
+
+    return transcribe(
+        model, seg_audio, mel=local_mel, verbose=verbose, **_worker_state["kwargs"]
     )
 
 
@@ -382,10 +1178,22 @@ def transcribe_with_vad(
     vad_pipeline,
     mel=None,
     verbose: Optional[bool] = None,
+    reuse_repeats: bool = False,
+    num_workers: int = 1,
     **kwargs,
 ):
     """
     Transcribe per VAD segment
+
+    With `reuse_repeats`, chunks that repeat earlier audio (see `find_repeated_sections`) are not
+    decoded; the text and the segment timings decoded for the earlier occurrence are transplanted.
+    Every transplant is verified against the audio (see `_verify_transplant`), chunks failing the
+    check are decoded after all. The share of the chunk duration that skipped decoding is
+    returned as "reused_fraction".
+
+    With `num_workers` > 1 and `condition_on_previous_text=False` the chunks do not depend on each
+    other and are decoded by a pool of forked processes sharing the model copy-on-write.
+    The results are merged in time order.
     """
 
     vad_segments = vad_pipeline(audio)
@@ -395,46 +1203,688 @@ def transcribe_with_vad(
     audio = load_audio(audio)
     audio = torch.from_numpy(audio)
 
-    prev = 0
-    output = {"segments": []}
+    output = {"segments": [], "fallbacks": 0, "reused_fraction": 0.0}
 
     # merge segments to approx 30s inputs to make whisper most appropraite
     vad_segments = merge_chunks(vad_segments, chunk_size=CHUNK_LENGTH)
     if len(vad_segments) == 0:
         return output
 
+    repeats = find_repeated_sections(audio, vad_segments) if reuse_repeats else {}
+
     if verbose:
         print(">>Performing transcription...")
 
+    def decode_chunks(indices) -> dict:
+        chunks = [
+            (vad_segments[sdx]["start"], vad_segments[sdx]["end"]) for sdx in indices
+        ]
+        if (
+            num_workers > 1
+            and not kwargs.get("condition_on_previous_text", True)
+            and len(chunks) > 1
+        ):
+            context = multiprocessing.get_context("fork")
+            num_threads = max(1, torch.get_num_threads() // num_workers)
+            with context.Pool(
+                num_workers, initializer=_init_worker, initargs=(num_threads,)
+            ) as pool:
+                results = pool.starmap(_transcribe_chunk, chunks)
+        else:
+            results = [_transcribe_chunk(start, end) for start, end in chunks]
+
+        return dict(zip(indices, results))
+
+    _worker_state.update(model=model, audio=audio, verbose=verbose, kwargs=kwargs)
+    try:
+        results = decode_chunks(
+            [sdx for sdx in range(len(vad_segments)) if sdx not in repeats]
+        )
+
+        decoded = [
+            _chunk_output(vad_segments[sdx], results[sdx]) for sdx in sorted(results)
+        ]
+        transplants = {}
+        failed = []
+        for sdx, offset in repeats.items():
+            seg_t = vad_segments[sdx]
+            transplant = _transplant(seg_t, decoded, offset)
+
+            if not _verify_transplant(audio, transplant, offset):
+                if verbose:
+                    print(
+                        f"~~ Transplant failed verification, decoding VAD chunk: ({format_timestamp(seg_t['start'])} --> {format_timestamp(seg_t['end'])}) ~~"
+                    )
+                failed.append(sdx)
+                continue
+
+            if verbose:
+                print(
+                    f"~~ Reusing transcription of {format_timestamp(transplant['reused-from'])} for: ({format_timestamp(seg_t['start'])} --> {format_timestamp(seg_t['end'])}) ~~"
+                )
+            transplants[sdx] = transplant
+
+        results.update(decode_chunks(failed))
+    finally:
+        _worker_state.clear()
+
+    reused_duration = 0.0
     for sdx, seg_t in enumerate(vad_segments):
+        if sdx in transplants:
+            chunk_output = transplants[sdx]
+            reused_duration += seg_t["end"] - seg_t["start"]
+        else:
+            chunk_output = _chunk_output(seg_t, results[sdx])
+            output["fallbacks"] += results[sdx]["fallbacks"]
+
+        seg_t["text"] = chunk_output["text"]
+        output["segments"].append(chunk_output)
+
+    output["language"] = output["segments"][0]["language"]
+    output["reused_fraction"] = reused_duration / sum(
+        seg_t["end"] - seg_t["start"] for seg_t in vad_segments
+    )
+
+    return output
+
+
+def benchmark_parallel_vad(
+    model: "Whisper",
+    audio: str,
+    vad_pipeline,
+    worker_counts: Tuple[int, ...] = (1, 2, 4, 8),
+    **kwargs,
+):
+    """
+    Transcribe the same audio with `transcribe_with_vad` for every number of workers and report
+    the wall time and the speedup over a single worker.
+    """
+    kwargs = {"fp16": False, "show_progress": False, **kwargs}
+    kwargs["condition_on_previous_text"] = False
+
+    seconds = {}
+    for num_workers in worker_counts:
+        started_at = time.perf_counter()
+        transcribe_with_vad(
+            model, audio, vad_pipeline, num_workers=num_workers, **kwargs
+        )
+        seconds[num_workers] = time.perf_counter() - started_at
+
+    return {
+        num_workers: {
+            "seconds": seconds[num_workers],
+            "speedup": seconds[worker_counts[0]] / seconds[num_workers],
+        }
+        for num_workers in worker_counts
+    }
+
+
+def transcribe_cascade(
+    draft_model: "Whisper",
+    model: "Whisper",
+    audio: Union[str, np.ndarray, torch.Tensor],
+    cascade_logprob_threshold: Optional[float] = -0.8,
+    cascade_no_speech_threshold: Optional[float] = 0.4,
+    cascade_compression_ratio_threshold: Optional[float] = 2.0,
+    verbose: Optional[bool] = None,
+    **kwargs,
+):
+    """
+    Transcribe everything with a small draft model first and re-decode only the windows whose
+    segments fall outside the confidence thresholds with the larger model. Windows the draft model
+    skipped as silence, and any audio between its windows, are re-decoded too, so that a draft
+    model that misses quiet vocals cannot drop them from the transcript.
+
+    Returns the same dictionary as `transcribe`, plus the share of the audio duration that had to
+    be decoded by the larger model ("cascade_share").
+    """
+
+    if isinstance(audio, str):
+        audio = load_audio(audio)
+    if not torch.is_tensor(audio):
+        audio = torch.from_numpy(audio)
+
+    duration = len(audio) / SAMPLE_RATE
+    window_prompt = kwargs.pop("window_prompt", None)
+
+    draft_result = transcribe(
+        draft_model, audio, verbose=verbose, window_prompt=window_prompt, **kwargs
+    )
+    kwargs["language"] = draft_result["language"]
+    fallbacks = draft_result["fallbacks"]
+
+    # segments decoded from the same window share the seek they were decoded at
+    windows = {}
+    for segment in draft_result["segments"]:
+        windows.setdefault(segment["seek"], []).append(segment)
+    skipped = {window["seek"]: window for window in draft_result["skipped"]}
+    seeks = sorted(set(windows) | set(skipped))
+    content_frames = len(audio) // HOP_LENGTH
+
+    def is_confident(segment) -> bool:
+        if not segment["text"].strip():
+            return True
+        if (
+            cascade_logprob_threshold is not None
+            and segment["avg_logprob"] < cascade_logprob_threshold
+        ):
+            return False
+        if (
+            cascade_no_speech_threshold is not None
+            and segment["no_speech_prob"] > cascade_no_speech_threshold
+        ):
+            return False
+        if (
+            cascade_compression_ratio_threshold is not None
+            and segment["compression_ratio"] > cascade_compression_ratio_threshold
+        ):
+            return False
+        return True
+
+    # (seek, end_seek, draft segments or None if the main model has to decode the span)
+    spans = []
+    covered = 0
+    for i, seek in enumerate(seeks):
+        if seek > covered:
+            # audio between two windows of the draft model
+            spans.append((covered, seek, None))
+
+        end_seek = seek + N_FRAMES
+        if i + 1 < len(seeks):
+            end_seek = min(end_seek, seeks[i + 1])
+        covered = max(covered, end_seek)
+
+        if seek in skipped:
+            if verbose:
+                print(
+                    f"~~ Draft model skipped window as silence "
+                    f"(no_speech_prob={skipped[seek]['no_speech_prob']:.2f}) ~~"
+                )
+            spans.append((seek, end_seek, None))
+        elif all(is_confident(segment) for segment in windows[seek]):
+            spans.append((seek, end_seek, windows[seek]))
+        else:
+            spans.append((seek, end_seek, None))
+
+    if content_frames > covered:
+        spans.append((covered, content_frames, None))
+
+    segments = []
+    redecoded_duration = 0.0
+
+    for seek, end_seek, draft_segments in spans:
+        if draft_segments is not None:
+            segments.extend(draft_segments)
+            continue
+
+        start = seek * HOP_LENGTH / SAMPLE_RATE
+        end = min(end_seek * HOP_LENGTH / SAMPLE_RATE, duration)
+        if end <= start:
+            continue
+
         if verbose:
             print(
-                f"~~ Transcribing VAD chunk: ({format_timestamp(seg_t['start'])} --> {format_timestamp(seg_t['end'])}) ~~"
+                f"~~ Re-decoding window: ({format_timestamp(start)} --> {format_timestamp(end)}) ~~"
+            )
+
+        window_mel = log_mel_spectrogram(
+            audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+            padding=N_SAMPLES,
+        )
+        window_kwargs = dict(kwargs)
+        if window_prompt is not None:
+            window_kwargs["window_prompt"] = lambda s, e, offset=start: window_prompt(
+                s + offset, e + offset
+            )
+
+        window_result = transcribe(
+            model, mel=window_mel, verbose=verbose, **window_kwargs
+        )
+        fallbacks += window_result["fallbacks"]
+        redecoded_duration += end - start
+
+        for segment in window_result["segments"]:
+            segment["seek"] += seek
+            segment["start"] += start
+            segment["end"] += start
+            for word in segment.get("words", []):
+                word["start"] += start
+                word["end"] += start
+            segments.append(segment)
+
+    segments = [{**segment, "id": i} for i, segment in enumerate(segments)]
+
+    return dict(
+        text="".join(segment["text"] for segment in segments),
+        segments=segments,
+        language=draft_result["language"],
+        fallbacks=fallbacks,
+        cascade_share=redecoded_duration / duration if duration else 0.0,
+    )
+
+
+def benchmark_speculative_decoding(
+    model: "Whisper",
+    draft_model: "Whisper",
+    audio: Union[str, np.ndarray, torch.Tensor],
+    num_draft_tokens: int = 4,
+    **kwargs,
+):
+    """
+    Transcribe the audio greedily with and without the draft model, check that both produce the
+    same token stream and report the decoded tokens per second of both runs.
+    """
+    kwargs = {"temperature": 0.0, "fp16": False, "show_progress": False, **kwargs}
+    mel = log_mel_spectrogram(audio, padding=N_SAMPLES)
+
+    results = {}
+    for mode, options in (
+        ("greedy", {}),
+        (
+            "speculative",
+            {"draft_model": draft_model, "num_draft_tokens": num_draft_tokens},
+        ),
+    ):
+        started_at = time.perf_counter()
+        result = transcribe(model, mel=mel, **options, **kwargs)
+        seconds = time.perf_counter() - started_at
+
+        tokens = [
+            token for segment in result["segments"] for token in segment["tokens"]
+        ]
+        results[mode] = {
+            "tokens": tokens,
+            "seconds": seconds,
+            "tokens_per_second": len(tokens) / seconds if seconds else 0.0,
+        }
+
+    return {
+        "identical": results["greedy"]["tokens"] == results["speculative"]["tokens"],
+        "greedy_tokens_per_second": results["greedy"]["tokens_per_second"],
+        "speculative_tokens_per_second": results["speculative"]["tokens_per_second"],
+    }
+
+
+class BatchWindow(NamedTuple):
+    song_id: Hashable
+    seek: int
+    mel: torch.Tensor
+    num_frames: int
+
+
+class BatchTranscriptionService:
+    """
+    Transcribes the 30-second windows of many queued songs together, so the decoder always runs
+    on full batches instead of the partial batches at the end of every single song. Results are
+    routed back to their song with the timestamps offset by the position of the window.
+
+    Windows are decoded independently (without conditioning on the previous window), windows that
+    fail the thresholds are queued again at the next temperature.
+    """
+
+    def __init__(
+        self,
+        model: "Whisper",
+        batch_size: int = 16,
+        temperature: Union[float, Tuple[float, ...]] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        compression_ratio_threshold: Optional[float] = 2.4,
+        logprob_threshold: Optional[float] = -1.0,
+        no_speech_threshold: Optional[float] = 0.6,
+        **decode_options,
+    ):
+        self.model = model
+        self.batch_size = batch_size
+        self.temperatures = (
+            [temperature] if isinstance(temperature, (int, float)) else temperature
+        )
+        self.compression_ratio_threshold = compression_ratio_threshold
+        self.logprob_threshold = logprob_threshold
+        self.no_speech_threshold = no_speech_threshold
+
+        # default for submit, the language is chosen per song
+        self.language = decode_options.pop("language", None)
+
+        self.dtype = (
+            torch.float16 if decode_options.get("fp16", True) else torch.float32
+        )
+        if model.device == torch.device("cpu"):
+            self.dtype = torch.float32
+        decode_options["fp16"] = self.dtype == torch.float16
+        self.decode_options = decode_options
+
+        self.time_precision = (
+            exact_div(N_FRAMES, model.dims.n_audio_ctx) * HOP_LENGTH / SAMPLE_RATE
+        )
+
+        # pending windows per (language, temperature index), so a batch shares its options
+        self._queue = {}
+        self._results = {}
+        self._remaining = {}
+
+        self.batches = 0
+        self.decoded_windows = 0
+
+    @property
+    def fill_rate(self) -> float:
+        """Average share of the batch size that was used by the decoded batches"""
+        if not self.batches:
+            return 0.0
+        return self.decoded_windows / (self.batches * self.batch_size)
+
+    def submit(
+        self,
+        song_id: Hashable,
+        audio: Union[str, np.ndarray, torch.Tensor],
+        language: Optional[str] = None,
+    ):
+        """
+        Queue the windows of a song. Without a language (here or passed to the constructor), it
+        is detected from the first window.
+        """
+        mel = log_mel_spectrogram(audio, padding=N_SAMPLES)
+        content_frames = mel.shape[-1] - N_FRAMES
+
+        if language is None:
+            language = self.language
+        if language is None:
+            language = self._detect_language(mel)
+
+        seeks = range(0, content_frames, N_FRAMES)
+        self._results[song_id] = {"segments": [], "language": language, "fallbacks": 0}
+        self._remaining[song_id] = len(seeks)
+
+        for seek in seeks:
+            self._queue.setdefault((language, 0), []).append(
+                BatchWindow(
+                    song_id,
+                    seek,
+                    pad_or_trim(mel[:, seek : seek + N_FRAMES], N_FRAMES),
+                    min(N_FRAMES, content_frames - seek),
+                )
+            )
+
+    def run(self) -> dict:
+        """
+        Decode all queued windows and return the transcription of every finished song, keyed by
+        the song id, with the "text", "segments", "language" and "fallbacks" of `transcribe`.
+        """
+        while self._queue:
+            key = max(self._queue, key=lambda k: len(self._queue[k]))
+            windows = self._queue[key][: self.batch_size]
+            self._queue[key] = self._queue[key][self.batch_size :]
+            if not self._queue[key]:
+                del self._queue[key]
+
+            self._decode_batch(*key, windows)
+
+        finished = {}
+        for song_id, remaining in list(self._remaining.items()):
+            if remaining:
+                continue
+
+            result = self._results.pop(song_id)
+            del self._remaining[song_id]
+
+            segments = sorted(result["segments"], key=lambda s: s["start"])
+            finished[song_id] = dict(
+                text="".join(segment["text"] for segment in segments),
+                segments=[{"id": i, **segment} for i, segment in enumerate(segments)],
+                language=result["language"],
+                fallbacks=result["fallbacks"],
+            )
+
+        return finished
+
+    def _detect_language(self, mel: torch.Tensor) -> str:
+        if not self.model.is_multilingual:
+            return "en"
+
+        mel_segment = pad_or_trim(mel, N_FRAMES).to(self.model.device).to(self.dtype)
+        _, probs = self.model.detect_language(mel_segment)
+        return max(probs, key=probs.get)
+
+    def _decode_batch(self, language: str, temperature_index: int, windows):
+        t = self.temperatures[temperature_index]
+
+        kwargs = {**self.decode_options}
+        if t > 0:
+            # disable beam_size and patience when t > 0
+            kwargs.pop("beam_size", None)
+            kwargs.pop("patience", None)
+        else:
+            # disable best_of when t == 0
+            kwargs.pop("best_of", None)
+
+        options = DecodingOptions(**kwargs, language=language, temperature=t)
+        mel = torch.stack([window.mel for window in windows])
+        results = self.model.decode(mel.to(self.model.device).to(self.dtype), options)
+
+        self.batches += 1
+        self.decoded_windows += len(windows)
+
+        for window, result in zip(windows, results):
+            needs_fallback = (
+                self.compression_ratio_threshold is not None
+                and result.compression_ratio > self.compression_ratio_threshold
+            ) or (
+                self.logprob_threshold is not None
+                and result.avg_logprob < self.logprob_threshold
+            )
+            if needs_fallback and temperature_index + 1 < len(self.temperatures):
+                self._results[window.song_id]["fallbacks"] += 1
+                self._queue.setdefault((language, temperature_index + 1), []).append(
+                    window
+                )
+                continue
+
+            self._remaining[window.song_id] -= 1
+
+            if self.no_speech_threshold is not None:
+                should_skip = result.no_speech_prob > self.no_speech_threshold
+                if (
+                    self.logprob_threshold is not None
+                    and result.avg_logprob > self.logprob_threshold
+                ):
+                    should_skip = False
+
+                if should_skip:
+                    continue
+
+            self._results[window.song_id]["segments"].extend(
+                self._split_segments(window, result, language)
             )
-        seg_f_start, seg_f_end = int(seg_t["start"] * SAMPLE_RATE), int(
-            seg_t["end"] * SAMPLE_RATE
+
+    def _split_segments(self, window: BatchWindow, result: DecodingResult, language):
+        tokenizer = get_tokenizer(
+            self.model.is_multilingual,
+            language=language,
+            task=self.decode_options.get("task", "transcribe"),
         )
-        local_f_start, local_f_end = seg_f_start - prev, seg_f_end - prev
-        audio = audio[local_f_start:]  # seek forward
-        seg_audio = audio[: local_f_end - local_f_start]  # seek forward
-        prev = seg_f_start
-        local_mel = log_mel_spectrogram(seg_audio, padding=N_SAMPLES)
-        # need to pad
-
-        result = transcribe(model, audio, mel=local_mel, verbose=verbose, **kwargs)
-        seg_t["text"] = result["text"]
-        output["segments"].append(
-            {
-                "start": seg_t["start"],
-                "end": seg_t["end"],
-                "language": result["language"],
-                "text": result["text"],
-                "seg-text": [x["text"] for x in result["segments"]],
-                "seg-start": [x["start"] for x in result["segments"]],
-                "seg-end": [x["end"] for x in result["segments"]],
+        tokens = torch.tensor(result.tokens)
+        time_offset = float(window.seek * HOP_LENGTH / SAMPLE_RATE)
+        duration = window.num_frames * HOP_LENGTH / SAMPLE_RATE
+
+        def new_segment(start, end, segment_tokens):
+            segment_tokens = segment_tokens.tolist()
+            return {
+                "seek": window.seek,
+                "start": start,
+                "end": end,
+                "text": tokenizer.decode(
+                    [token for token in segment_tokens if token < tokenizer.eot]
+                ),
+                "tokens": segment_tokens,
+                "temperature": result.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob,
             }
+
+        timestamp_tokens: torch.Tensor = tokens.ge(tokenizer.timestamp_begin)
+        consecutive = torch.where(timestamp_tokens[:-1] & timestamp_tokens[1:])[0]
+        consecutive.add_(1)
+
+        if len(consecutive) == 0:
+            timestamps = tokens[timestamp_tokens.nonzero().flatten()]
+            if (
+                len(timestamps) > 0
+                and timestamps[-1].item() != tokenizer.timestamp_begin
+            ):
+                # no consecutive timestamps but it has a timestamp; use the last one.
+                last_timestamp_pos = timestamps[-1].item() - tokenizer.timestamp_begin
+                duration = last_timestamp_pos * self.time_precision
+
+            return [new_segment(time_offset, time_offset + duration, tokens)]
+
+        slices = consecutive.tolist()
+        if timestamp_tokens[-2:].tolist() == [False, True]:
+            slices.append(len(tokens))
+
+        segments = []
+        last_slice = 0
+        for current_slice in slices:
+            sliced_tokens = tokens[last_slice:current_slice]
+            start_timestamp_pos = sliced_tokens[0].item() - tokenizer.timestamp_begin
+            end_timestamp_pos = sliced_tokens[-1].item() - tokenizer.timestamp_begin
+            segments.append(
+                new_segment(
+                    time_offset + start_timestamp_pos * self.time_precision,
+                    time_offset + end_timestamp_pos * self.time_precision,
+                    sliced_tokens,
+                )
+            )
+            last_slice = current_slice
+
+        # windows are not re-seeked, so keep the unfinished segment until the window ends
+        rest = tokens[last_slice:]
+        if any(token < tokenizer.eot for token in rest.tolist()):
+            start = time_offset
+            if rest[0].item() >= tokenizer.timestamp_begin:
+                start += (
+                    rest[0].item() - tokenizer.timestamp_begin
+                ) * self.time_precision
+            segments.append(new_segment(start, time_offset + duration, rest))
+
+        return segments
+
+
+def benchmark_word_timestamps(
+    model: "Whisper",
+    audio: Union[str, np.ndarray, torch.Tensor],
+    batch_size: int = 8,
+    **kwargs,
+):
+    """
+    Compute the word timestamps of a full song once per window and once in batches over the same
+    windows and report the time of both and the largest difference between their word timings.
+    """
+    kwargs = {"fp16": False, "show_progress": False, **kwargs}
+    mel = log_mel_spectrogram(audio, padding=N_SAMPLES)
+    content_frames = mel.shape[-1] - N_FRAMES
+
+    result = transcribe(model, mel=mel, **kwargs)
+    tokenizer = get_tokenizer(model.is_multilingual, language=result["language"])
+
+    windows = {}
+    for segment in result["segments"]:
+        windows.setdefault(segment["seek"], []).append(segment)
+
+    def get_windows():
+        return [
+            (
+                [{**segment} for segment in segments],
+                pad_or_trim(mel[:, seek : seek + N_FRAMES], N_FRAMES).to(model.device),
+                min(N_FRAMES, content_frames - seek),
+            )
+            for seek, segments in sorted(windows.items())
+        ]
+
+    per_window = get_windows()
+    started_at = time.perf_counter()
+    for segments, mel_segment, num_frames in per_window:
+        add_word_timestamps(
+            segments=segments,
+            model=model,
+            tokenizer=tokenizer,
+            mel=mel_segment,
+            num_frames=num_frames,
         )
+    per_window_seconds = time.perf_counter() - started_at
 
-    output["language"] = output["segments"][0]["language"]
+    batched = get_windows()
+    started_at = time.perf_counter()
+    for i in range(0, len(batched), batch_size):
+        add_word_timestamps_batched(
+            windows=batched[i : i + batch_size], model=model, tokenizer=tokenizer
+        )
+    batched_seconds = time.perf_counter() - started_at
+
+    per_window_words = [w for s, _, _ in per_window for x in s for w in x["words"]]
+    batched_words = [w for s, _, _ in batched for x in s for w in x["words"]]
+
+    return {
+        "per_window_seconds": per_window_seconds,
+        "batched_seconds": batched_seconds,
+        "same_words": [w["word"] for w in per_window_words]
+        == [w["word"] for w in batched_words],
+        "max_timing_difference": max(
+            (
+                max(abs(a["start"] - b["start"]), abs(a["end"] - b["end"]))
+                for a, b in zip(per_window_words, batched_words)
+            ),
+            default=0.0,
+        ),
+    }
+
+
+def align_chunked(
+    segments: List[dict],
+    align_model,
+    metadata: dict,
+    audio: np.ndarray,
+    device: str,
+    padding: float = 0.1,
+    **kwargs,
+):
+    """
+    Forced alignment of one transcript segment at a time. Only the audio of the current segment
+    (plus `padding` seconds on both sides) is passed to `whisperx.align`, the loaded alignment
+    model is reused and the word timestamps are shifted back to the position in the song, so the
+    memory use does not grow with the length of the song.
+    """
+    duration = len(audio) / SAMPLE_RATE
+    output = {"segments": [], "word_segments": []}
+
+    def shift(item: dict, offset: float):
+        for key in ("start", "end"):
+            if item.get(key) is not None:
+                item[key] += offset
+
+    for segment in segments:
+        offset = max(segment["start"] - padding, 0.0)
+        end = min(segment["end"] + padding, duration)
+
+        result = align(
+            [
+                {
+                    **segment,
+                    "start": segment["start"] - offset,
+                    "end": segment["end"] - offset,
+                }
+            ],
+            align_model,
+            metadata,
+            audio[int(offset * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+            device,
+            **kwargs,
+        )
+
+        # word_segments holds the same dicts as the words of the segments, shift them once
+        for aligned_segment in result["segments"]:
+            shift(aligned_segment, offset)
+            for word in aligned_segment.get("words", []):
+                shift(word, offset)
+            output["segments"].append(aligned_segment)
+            output["word_segments"].extend(aligned_segment.get("words", []))
 
     return output
@@ -1,13 +1,19 @@
-import requests
+import http_client
 
 
 QUERY_TEMPLATE = "https://itunes.apple.com/search?term=%s&media=music&entity=album"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.55 Safari/537.36"
 
+# how long search results and cover images are cached on disk, in seconds
+SEARCH_TTL = 7 * 24 * 60 * 60
+COVER_TTL = 30 * 24 * 60 * 60
+
 
 def get_cover_url(song_query, verbose=False, throttle=1):
     url = QUERY_TEMPLATE % song_query
-    response = requests.get(url, headers={"User-Agent": USER_AGENT})
+    response = http_client.get(
+        url, headers={"User-Agent": USER_AGENT}, ttl=SEARCH_TTL, provider="itunes"
+    )
     response.raise_for_status()
 
     data = response.json()["results"]
@@ -25,7 +31,9 @@ def download_cover(song_query, output_path=None):
 
     print(f"Downloading cover from {url}")
 
-    response = requests.get(url, headers={"User-Agent": USER_AGENT})
+    response = http_client.get(
+        url, headers={"User-Agent": USER_AGENT}, ttl=COVER_TTL, provider="itunes"
+    )
     response.raise_for_status()
 
     if not response.content:
@@ -0,0 +1,292 @@
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CACHE_PATH = os.path.expanduser("~/.cache/karaoke-ai/http")
+
+POOL_SIZE = 16
+
+# requests per second and burst size per provider, shared by all threads
+RATE_LIMITS = {
+    "spotify": (5.0, 10),
+    "netease": (5.0, 10),
+    "itunes": (1.0, 5),
+}
+
+# retries of 429 and 5xx responses, waiting RETRY_BASE_DELAY * 2 ** attempt seconds (or
+# as long as Retry-After says) but never longer than RETRY_MAX_DELAY
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+_buckets = {}
+_metrics = {}
+_limits_lock = threading.Lock()
+
+# cancel event and deadline of the requests of the current thread, see cancellable
+_scope = threading.local()
+
+
+class Cancelled(requests.RequestException):
+    """
+    Raised by get when its cancel event is set or its deadline has passed.
+    """
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available. Returns the seconds waited.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+
+            # reserve the token now, so that concurrent callers queue up behind it
+            self.tokens -= 1
+            wait_seconds = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait_seconds:
+            time.sleep(wait_seconds)
+
+        return wait_seconds
+
+
+def _get_bucket(provider) -> Optional[TokenBucket]:
+    if provider not in RATE_LIMITS:
+        return None
+
+    with _limits_lock:
+        if provider not in _buckets:
+            _buckets[provider] = TokenBucket(*RATE_LIMITS[provider])
+
+        return _buckets[provider]
+
+
+def _record(provider, **values):
+    if provider is None:
+        return
+
+    with _limits_lock:
+        metrics = _metrics.setdefault(
+            provider,
+            {
+                "requests": 0,
+                "retries": 0,
+                "throttled": 0,
+                "rate_limit_wait_seconds": 0.0,
+                "backoff_seconds": 0.0,
+            },
+        )
+        for key, value in values.items():
+            metrics[key] += value
+
+
+def get_metrics() -> dict:
+    """
+    Requests, retries, 429 responses and seconds spent waiting per provider.
+    """
+    with _limits_lock:
+        return {provider: dict(metrics) for provider, metrics in _metrics.items()}
+
+
+def reset_metrics():
+    with _limits_lock:
+        _metrics.clear()
+
+
+def _get_retry_delay(response: requests.Response, attempt) -> float:
+    delay = RETRY_BASE_DELAY * 2**attempt
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            pass
+
+    return min(delay, RETRY_MAX_DELAY)
+
+
+@contextlib.contextmanager
+def cancellable(cancel: Optional[threading.Event] = None, deadline=None):
+    """
+    Requests made by the current thread within the block give up with Cancelled once cancel is
+    set or the deadline (in time.monotonic seconds) has passed, so that callers several levels
+    up can abandon them without threading the event through every function in between.
+    """
+    previous = getattr(_scope, "value", (None, None))
+    _scope.value = (cancel, deadline)
+    try:
+        yield
+    finally:
+        _scope.value = previous
+
+
+def _check_cancelled(url, cancel, deadline):
+    if cancel is not None and cancel.is_set():
+        raise Cancelled(f"Request to {url} was cancelled")
+    if deadline is not None and deadline <= time.monotonic():
+        raise Cancelled(f"Request to {url} ran past its deadline")
+
+
+def _wait(seconds, url, cancel, deadline):
+    if deadline is not None and time.monotonic() + seconds >= deadline:
+        raise Cancelled(f"Request to {url} would wait past its deadline")
+
+    if cancel is not None:
+        if cancel.wait(seconds):
+            raise Cancelled(f"Request to {url} was cancelled")
+    else:
+        time.sleep(seconds)
+
+
+def get_session(url) -> requests.Session:
+    """
+    Session for the host of url, so that requests to the same host reuse its connections.
+    """
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+
+    with _sessions_lock:
+        if host not in _sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount(f"{parts.scheme}://", adapter)
+            _sessions[host] = session
+
+        return _sessions[host]
+
+
+def _get_cache_file(cache_key, cache_path) -> str:
+    digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    return os.path.join(cache_path, digest[:2], digest)
+
+
+def _read_cache(cache_file, url) -> Optional[requests.Response]:
+    try:
+        with open(cache_file, "rb") as f:
+            meta = json.loads(f.readline())
+            content = f.read()
+    except (OSError, ValueError):
+        return None
+
+    if meta["expires_at"] <= time.time():
+        return None
+
+    response = requests.Response()
+    response.status_code = meta["status_code"]
+    response.headers.update(meta["headers"])
+    response.url = url
+    response._content = content
+    return response
+
+
+def _write_cache(cache_file, response: requests.Response, expires_at):
+    meta = {
+        "expires_at": expires_at,
+        "status_code": response.status_code,
+        "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+    }
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+    # write to a temporary file first, so that concurrent readers never see half a file
+    temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}"
+    with open(temp_file, "wb") as f:
+        f.write(json.dumps(meta).encode("utf-8") + b"\n")
+        f.write(response.content)
+    os.replace(temp_file, cache_file)
+
+
+def get(
+    url,
+    headers=None,
+    ttl: Union[float, Callable[[requests.Response], float], None] = None,
+    cache_key=None,
+    cache_path=CACHE_PATH,
+    timeout=30,
+    provider=None,
+    max_retries=MAX_RETRIES,
+    cancel: Optional[threading.Event] = None,
+    deadline=None,
+) -> requests.Response:
+    """
+    GET url with the pooled session of its host. Successful responses are cached on disk
+    for ttl seconds, or for as long as ttl(response) returns, under cache_key (the url by
+    default, use a different key if the response depends on the headers).
+
+    Requests to a provider in RATE_LIMITS are rate limited, and 429 and 5xx responses
+    are retried up to max_retries times with exponential backoff.
+
+    Cancelled is raised before an attempt or during a backoff once cancel is set or the
+    deadline (in time.monotonic seconds) has passed, and the timeout of every attempt is
+    clamped to the deadline. Both default to those of the enclosing cancellable block.
+    """
+    if cancel is None and deadline is None:
+        cancel, deadline = getattr(_scope, "value", (None, None))
+
+    cache_file = None
+    if ttl is not None and cache_path:
+        cache_file = _get_cache_file(cache_key or url, cache_path)
+        response = _read_cache(cache_file, url)
+        if response is not None:
+            return response
+
+    bucket = _get_bucket(provider)
+
+    for attempt in range(max_retries + 1):
+        _check_cancelled(url, cancel, deadline)
+        if bucket:
+            _record(provider, rate_limit_wait_seconds=bucket.acquire())
+            _check_cancelled(url, cancel, deadline)
+
+        attempt_timeout = timeout
+        if deadline is not None:
+            # requests rejects timeouts <= 0, the deadline may pass right after the check
+            attempt_timeout = max(min(timeout, deadline - time.monotonic()), 1e-3)
+
+        response = get_session(url).get(url, headers=headers, timeout=attempt_timeout)
+        _record(provider, requests=1, throttled=int(response.status_code == 429))
+
+        if response.status_code != 429 and response.status_code < 500:
+            break
+
+        if attempt < max_retries:
+            delay = _get_retry_delay(response, attempt)
+            _record(provider, retries=1, backoff_seconds=delay)
+            _wait(delay, url, cancel, deadline)
+
+    if cache_file and response.status_code == 200:
+        seconds = ttl(response) if callable(ttl) else ttl
+        if seconds > 0:
+            _write_cache(cache_file, response, time.time() + seconds)
+
+    return response
+
+
+def clear_cache(cache_path=CACHE_PATH):
+    import shutil
+
+    shutil.rmtree(cache_path, ignore_errors=True)
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional, Tuple
+
+import http_client
+from lyrics import Lyrics, NetEaseLyricsExtractor, SpotifyLyricsExtractor
+
+# seconds to wait for each provider, and for all of them before falling back to whisper
+PROVIDER_TIMEOUTS = {"spotify": 10.0, "netease": 10.0}
+RESOLVE_BUDGET = 15.0
+
+MIN_SYNCED_SHARE = 0.8
+
+
+def get_providers() -> dict:
+    return {
+        "spotify": SpotifyLyricsExtractor(),
+        "netease": NetEaseLyricsExtractor(),
+    }
+
+
+def is_synced(lyrics: Optional[Lyrics]) -> bool:
+    """
+    Whether most lines of the lyrics have a start time.
+    """
+    lines = [line for line in (lyrics.lines if lyrics else []) if line.words]
+    if not lines:
+        return False
+
+    synced = sum(line.start is not None for line in lines)
+    return synced / len(lines) >= MIN_SYNCED_SHARE
+
+
+def resolve_lyrics(
+    name,
+    audio_file,
+    providers: dict = None,
+    timeouts: dict = None,
+    budget=RESOLVE_BUDGET,
+    fallback: Callable[[str, str], Lyrics] = None,
+    is_acceptable: Callable[[Lyrics], bool] = is_synced,
+    verbose=True,
+) -> Tuple[Optional[str], Optional[Lyrics]]:
+    """
+    Query all providers concurrently and return the name and lyrics of the first one with
+    an acceptable result. Providers that have not answered are abandoned then, or once
+    their timeout has passed: their requests are clamped to the timeout and cancelled
+    (see http_client.cancellable). If none succeeds within the budget, return the result
+    of fallback (as "fallback") if given, otherwise (None, None).
+    """
+    providers = providers if providers is not None else get_providers()
+    timeouts = {**PROVIDER_TIMEOUTS, **(timeouts or {})}
+
+    started_at = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(len(providers), 1))
+    cancel = threading.Event()
+    pending = {}
+
+    def extract(provider, deadline) -> Lyrics:
+        with http_client.cancellable(cancel, deadline):
+            return provider.extract(name, audio_file)
+
+    for provider_name, provider in providers.items():
+        timeout = min(timeouts.get(provider_name, budget), budget)
+        future = executor.submit(extract, provider, started_at + timeout)
+        pending[future] = (provider_name, started_at + timeout)
+
+    try:
+        while pending:
+            now = time.monotonic()
+            for future, (provider_name, deadline) in list(pending.items()):
+                if deadline <= now and not future.done():
+                    if verbose:
+                        print(f"{provider_name} timed out")
+                    del pending[future]
+
+            if not pending:
+                break
+
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(
+                pending,
+                timeout=max(next_deadline - now, 0),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                provider_name, _ = pending.pop(future)
+                try:
+                    lyrics = future.result()
+                except Exception as e:
+                    if verbose:
+                        print(f"{provider_name} failed: {e}")
+                    continue
+
+                if is_acceptable(lyrics):
+                    if verbose:
+                        seconds = time.monotonic() - started_at
+                        print(f"Lyrics found on {provider_name} after {seconds:.2f}s")
+                    return provider_name, lyrics
+
+                if verbose:
+                    print(f"No synced lyrics found on {provider_name}")
+    finally:
+        # stop the requests of providers that are still running, their results are dropped
+        cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if fallback is None:
+        return None, None
+
+    return "fallback", fallback(name, audio_file)
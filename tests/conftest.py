@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+class FakeServer:
+    """
+    Local HTTP server standing in for the lyrics and cover providers. The query of a request
+    controls the answer:
+
+    - latency: seconds to wait before answering
+    - status: status code of the answer
+    - fail: answer with status only to the first n requests of the path, 200 afterwards
+    - retry_after: Retry-After header of non-200 answers
+    - synced: whether the fake lyrics are synced (1, the default, or 0)
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = {
+                    key: values[0] for key, values in parse_qs(parts.query).items()
+                }
+
+                with server.lock:
+                    server.requests.append(self.path)
+                    server.connections.add(self.client_address)
+                    count = server.requests.count(self.path)
+
+                time.sleep(float(query.get("latency", 0)))
+
+                status = int(query.get("status", 200))
+                if "fail" in query and count > int(query["fail"]):
+                    status = 200
+
+                body = json.dumps(
+                    {
+                        "path": parts.path,
+                        "count": count,
+                        "synced": query.get("synced", "1") == "1",
+                        "expiresAtMs": int((time.time() + 60) * 1000),
+                    }
+                ).encode("utf-8")
+
+                self.send_response(status)
+                if status != 200 and "retry_after" in query:
+                    self.send_header("Retry-After", query["retry_after"])
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        # do not wait for slow answers nobody is waiting for anymore when closing
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def url(self, path) -> str:
+        return f"{self.base_url}{path}"
+
+    def count(self, path) -> int:
+        with self.lock:
+            return sum(urlsplit(request).path == path for request in self.requests)
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeServer()
+    threading.Thread(target=server.server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.server.shutdown()
+    server.server.server_close()
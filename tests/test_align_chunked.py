@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("whisper")
+pytest.importorskip("whisperx")
+
+import asr
+from asr import SAMPLE_RATE, align_chunked
+
+
+def fake_align(segments, align_model, metadata, audio, device, **kwargs):
+    """
+    Like whisperx.align: one word per text token, spread over the segment, and
+    word_segments holding the same dicts as the words of the segments.
+    """
+    aligned_segments = []
+    for segment in segments:
+        words = segment["text"].split()
+        step = (segment["end"] - segment["start"]) / len(words)
+        aligned_segments.append(
+            {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"],
+                "words": [
+                    {
+                        "word": word,
+                        "start": segment["start"] + i * step,
+                        "end": segment["start"] + (i + 1) * step,
+                    }
+                    for i, word in enumerate(words)
+                ],
+            }
+        )
+
+    word_segments = []
+    for segment in aligned_segments:
+        word_segments += segment["words"]
+
+    return {"segments": aligned_segments, "word_segments": word_segments}
+
+
+def test_words_are_shifted_once(monkeypatch):
+    monkeypatch.setattr(asr, "align", fake_align)
+    segments = [
+        {"start": 1.0, "end": 2.0, "text": "one two"},
+        {"start": 10.0, "end": 10.4, "text": "three four"},
+    ]
+    audio = np.zeros(20 * SAMPLE_RATE, dtype=np.float32)
+
+    result = align_chunked(segments, None, {}, audio, "cpu", padding=0.1)
+
+    expected = [
+        ("one", 1.0, 1.5),
+        ("two", 1.5, 2.0),
+        ("three", 10.0, 10.2),
+        ("four", 10.2, 10.4),
+    ]
+    for words in (
+        result["word_segments"],
+        [word for segment in result["segments"] for word in segment["words"]],
+    ):
+        assert [word["word"] for word in words] == [word for word, _, _ in expected]
+        for word, (_, start, end) in zip(words, expected):
+            assert word["start"] == pytest.approx(start)
+            assert word["end"] == pytest.approx(end)
+
+    assert [s["start"] for s in result["segments"]] == pytest.approx([1.0, 10.0])
+    assert [s["end"] for s in result["segments"]] == pytest.approx([2.0, 10.4])
@@ -0,0 +1,47 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisper")
+pytest.importorskip("whisperx")
+
+from whisper.audio import SAMPLE_RATE
+from whisper.model import ModelDimensions, Whisper
+
+from asr import BatchTranscriptionService
+
+DIMS = ModelDimensions(
+    n_mels=80,
+    n_audio_ctx=1500,
+    n_audio_state=64,
+    n_audio_head=2,
+    n_audio_layer=1,
+    n_vocab=51865,
+    n_text_ctx=448,
+    n_text_state=64,
+    n_text_head=2,
+    n_text_layer=2,
+)
+
+
+@pytest.fixture(scope="module")
+def model():
+    torch.manual_seed(0)
+    return Whisper(DIMS).eval()
+
+
+def test_language_passed_to_constructor(model):
+    torch.manual_seed(1)
+    service = BatchTranscriptionService(
+        model, batch_size=4, language="en", fp16=False, temperature=(0.0, 0.5)
+    )
+
+    for song_id in ("a", "b"):
+        service.submit(song_id, torch.randn(40 * SAMPLE_RATE) * 0.1)
+    service.submit("c", torch.randn(10 * SAMPLE_RATE) * 0.1, language="de")
+    results = service.run()
+
+    assert set(results) == {"a", "b", "c"}
+    assert [results[song_id]["language"] for song_id in "abc"] == ["en", "en", "de"]
+    for result in results.values():
+        assert set(result) == {"text", "segments", "language", "fallbacks"}
+        assert result["fallbacks"] >= 0
@@ -0,0 +1,39 @@
+from lyrics import Line, Lyrics, WhisperLyricsExtractor, Word, get_text_for_time_range
+
+
+def make_line(text, start) -> Line:
+    return Line([Word(word, None, None) for word in text.split()], start, None)
+
+
+def test_text_for_time_range():
+    lyrics = Lyrics(
+        [
+            make_line("first line", 1.0),
+            make_line("second line", 29.5),
+            make_line("untimed line", None),
+            make_line("third line", 30.0),
+            make_line("last line", 65.0),
+        ]
+    )
+
+    assert get_text_for_time_range(lyrics, 0.0, 30.0) == "first line second line"
+    assert get_text_for_time_range(lyrics, 30.0, 60.0) == "third line"
+    assert get_text_for_time_range(lyrics, 40.0, 60.0) == ""
+    assert get_text_for_time_range(lyrics, 60.0, 90.0) == "last line"
+
+
+def test_unsynced_lyrics_do_not_prompt_windows():
+    lyrics = Lyrics([make_line("first line", None), make_line("last line", None)])
+
+    assert get_text_for_time_range(lyrics, 0.0, 30.0) == ""
+
+    options = WhisperLyricsExtractor(reference_lyrics=lyrics)._conditioning_options()
+    assert "window_prompt" not in options
+    assert options["bias_words"] == {"first", "last", "line"}
+
+
+def test_synced_lyrics_prompt_windows():
+    lyrics = Lyrics([make_line("first line", 1.0), make_line("last line", 40.0)])
+
+    options = WhisperLyricsExtractor(reference_lyrics=lyrics)._conditioning_options()
+    assert options["window_prompt"](30.0, 60.0) == "last line"
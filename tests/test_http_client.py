@@ -0,0 +1,183 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import http_client
+
+
+def test_requests_reuse_pooled_connection(fake_server):
+    for _ in range(5):
+        http_client.get(fake_server.url("/uncached")).raise_for_status()
+
+    assert fake_server.count("/uncached") == 5
+    assert len(fake_server.connections) == 1
+
+
+def test_cached_response_is_not_requested_again(fake_server, tmp_path):
+    first = http_client.get(fake_server.url("/cached"), ttl=60, cache_path=tmp_path)
+    second = http_client.get(fake_server.url("/cached"), ttl=60, cache_path=tmp_path)
+
+    assert first.json() == second.json()
+    assert second.status_code == 200
+    assert fake_server.count("/cached") == 1
+
+
+def test_cached_response_expires(fake_server, tmp_path):
+    http_client.get(fake_server.url("/expiring"), ttl=0.2, cache_path=tmp_path)
+    time.sleep(0.3)
+    response = http_client.get(
+        fake_server.url("/expiring"), ttl=0.2, cache_path=tmp_path
+    )
+
+    assert response.json()["count"] == 2
+    assert fake_server.count("/expiring") == 2
+
+
+def test_ttl_from_response(fake_server, tmp_path):
+    # like the spotify token, which is valid until the time given in the response
+    def ttl(response):
+        return response.json()["expiresAtMs"] / 1000 - time.time()
+
+    for _ in range(2):
+        http_client.get(fake_server.url("/token"), ttl=ttl, cache_path=tmp_path)
+
+    assert fake_server.count("/token") == 1
+
+
+def test_cache_key_separates_responses(fake_server, tmp_path):
+    for cache_key in ("a", "b", "a"):
+        http_client.get(
+            fake_server.url("/token"), ttl=60, cache_key=cache_key, cache_path=tmp_path
+        )
+
+    assert fake_server.count("/token") == 2
+
+
+def test_error_responses_are_not_cached(fake_server, tmp_path):
+    for _ in range(2):
+        response = http_client.get(
+            fake_server.url("/missing?status=404"), ttl=60, cache_path=tmp_path
+        )
+        assert response.status_code == 404
+
+    assert fake_server.count("/missing") == 2
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    monkeypatch.setitem(http_client.RATE_LIMITS, "fake", (20.0, 1))
+    monkeypatch.setattr(http_client, "_buckets", {})
+    http_client.reset_metrics()
+    yield "fake"
+    http_client.reset_metrics()
+
+
+def test_throttled_requests_are_retried(fake_server, fake_provider):
+    response = http_client.get(
+        fake_server.url("/throttled?status=429&fail=2&retry_after=0.05"),
+        provider=fake_provider,
+    )
+
+    assert response.status_code == 200
+    metrics = http_client.get_metrics()[fake_provider]
+    assert metrics["requests"] == 3
+    assert metrics["retries"] == 2
+    assert metrics["throttled"] == 2
+    assert metrics["backoff_seconds"] == pytest.approx(0.1)
+
+
+def test_server_errors_are_retried(fake_server, fake_provider):
+    response = http_client.get(
+        fake_server.url("/unavailable?status=503&fail=1&retry_after=0.05"),
+        provider=fake_provider,
+    )
+
+    assert response.status_code == 200
+    assert fake_server.count("/unavailable") == 2
+
+
+def test_retries_give_up(fake_server, fake_provider):
+    response = http_client.get(
+        fake_server.url("/throttled?status=429&retry_after=0.01"),
+        provider=fake_provider,
+        max_retries=3,
+    )
+
+    assert response.status_code == 429
+    assert fake_server.count("/throttled") == 4
+
+
+def test_retry_delay():
+    response = requests.Response()
+    assert http_client._get_retry_delay(response, 2) == http_client.RETRY_BASE_DELAY * 4
+
+    response.headers["Retry-After"] = "1.5"
+    assert http_client._get_retry_delay(response, 0) == 1.5
+
+    response.headers["Retry-After"] = "3600"
+    assert http_client._get_retry_delay(response, 0) == http_client.RETRY_MAX_DELAY
+
+
+def test_threads_share_rate_limit(fake_server, fake_provider):
+    # 20 requests at 20 per second with a burst of 1 take about a second from any number
+    # of threads
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(4) as executor:
+        responses = list(
+            executor.map(
+                lambda i: http_client.get(
+                    fake_server.url("/ok"), provider=fake_provider
+                ),
+                range(20),
+            )
+        )
+    seconds = time.perf_counter() - started_at
+
+    assert all(response.status_code == 200 for response in responses)
+    assert seconds >= 0.9
+    metrics = http_client.get_metrics()[fake_provider]
+    assert metrics["requests"] == 20
+    assert metrics["rate_limit_wait_seconds"] > 0
+
+
+def test_cancel_interrupts_backoff(fake_server):
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    started_at = time.perf_counter()
+    with pytest.raises(http_client.Cancelled):
+        http_client.get(
+            fake_server.url("/unavailable?status=503&retry_after=5"), cancel=cancel
+        )
+
+    assert time.perf_counter() - started_at < 1.0
+    assert fake_server.count("/unavailable") == 1
+
+
+def test_cancelled_request_is_not_sent(fake_server):
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(http_client.Cancelled):
+        http_client.get(fake_server.url("/ok"), cancel=cancel)
+
+    assert fake_server.count("/ok") == 0
+
+
+def test_deadline_of_cancellable_block(fake_server):
+    with http_client.cancellable(deadline=time.monotonic() + 0.2):
+        # a backoff past the deadline is not waited for
+        with pytest.raises(http_client.Cancelled):
+            http_client.get(fake_server.url("/unavailable?status=503&retry_after=5"))
+
+        # the request timeout is clamped to the deadline
+        started_at = time.perf_counter()
+        with pytest.raises(requests.Timeout):
+            http_client.get(fake_server.url("/slow?latency=2"))
+        assert time.perf_counter() - started_at < 1.0
+
+    response = http_client.get(fake_server.url("/slow?latency=0.3"))
+    assert response.status_code == 200
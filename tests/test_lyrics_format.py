@@ -0,0 +1,58 @@
+import pytest
+
+from lyrics import (
+    LYRICS_FORMAT_VERSION,
+    Line,
+    Lyrics,
+    Word,
+    load_lyrics,
+    save_lyrics,
+)
+
+
+def make_lyrics() -> Lyrics:
+    return Lyrics(
+        [
+            Line([Word("Hello", 1.0, 1.5), Word("world", 1.5, None)], 1.0, 2.0),
+            Line([], 2.5, None),
+            Line([Word("hello", None, None), Word("Grüße ♪", 3.0, 3.25)], 3.0, None),
+            Line([Word("Hello", 4.0, 4.5)], None, None),
+        ]
+    )
+
+
+def test_round_trip():
+    lyrics = make_lyrics()
+
+    loaded = Lyrics.from_bytes(lyrics.to_bytes())
+
+    assert loaded.to_dict() == lyrics.to_dict()
+
+
+def test_round_trip_empty():
+    assert Lyrics.from_bytes(Lyrics([]).to_bytes()).to_dict() == {"lines": []}
+
+
+@pytest.mark.parametrize("extension", ["lyrics", "json"])
+def test_save_after_mutation(tmp_path, extension):
+    lyrics = make_lyrics()
+    lyrics.to_bytes()
+
+    lyrics.lines.append(Line([Word("again", 5.0, 5.5)], 5.0, 5.5))
+    lyrics.lines[0].words[0].start = 0.75
+    lyrics.lines[2].words.pop()
+
+    path = str(tmp_path / f"song.{extension}")
+    save_lyrics(lyrics, path)
+
+    assert load_lyrics(path).to_dict() == lyrics.to_dict()
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError, match="Not a lyrics file"):
+        Lyrics.from_bytes(b"\0" * 32)
+
+    data = bytearray(make_lyrics().to_bytes())
+    data[4:6] = (LYRICS_FORMAT_VERSION + 1).to_bytes(2, "little")
+    with pytest.raises(ValueError, match="Unsupported"):
+        Lyrics.from_bytes(bytes(data))
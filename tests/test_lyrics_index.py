@@ -0,0 +1,47 @@
+import numpy as np
+
+from lyrics import (
+    Line,
+    Lyrics,
+    LyricsIndex,
+    Word,
+    benchmark_lyrics_index,
+    get_word_times,
+)
+
+
+def make_lyrics() -> Lyrics:
+    return Lyrics(
+        [
+            Line([Word("one", 1.0, 1.5), Word("two", None, None)], 1.0, 2.0),
+            Line([Word("three", 3.0, 3.5)], 3.0, 3.5),
+        ]
+    )
+
+
+def test_views_follow_edits():
+    lyrics = make_lyrics()
+    assert lyrics.text == "one two three"
+    LyricsIndex(lyrics)
+
+    lyrics.lines.append(Line([Word("four", 5.0, 5.5)], 5.0, 5.5))
+    lyrics.lines[0].words[1].start = 1.5
+
+    assert lyrics.text == "one two three four"
+    assert [word.text for word in lyrics.words] == ["one", "two", "three", "four"]
+    np.testing.assert_array_equal(get_word_times(lyrics), [1.0, 1.5, 3.0, 5.0])
+    np.testing.assert_array_equal(lyrics.to_arrays().line_offsets, [0, 2, 3, 4])
+
+    index = LyricsIndex(lyrics)
+    assert index.line_at(5.2) is lyrics.lines[2]
+    assert index.word_at(1.6) is lyrics.lines[0].words[1]
+
+
+def test_word_times_fall_back_to_line_start():
+    lyrics = make_lyrics()
+
+    np.testing.assert_array_equal(get_word_times(lyrics), [1.0, 1.0, 3.0])
+
+
+def test_index_matches_scan():
+    assert benchmark_lyrics_index(fps=10)["mismatches"] == 0
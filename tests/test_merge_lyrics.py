@@ -0,0 +1,36 @@
+import pytest
+
+from lyrics import Line, Lyrics, Word, merge_lyrics_multi
+
+
+def make_lyrics(*words) -> Lyrics:
+    return Lyrics([Line.from_words([Word(*word) for word in words])])
+
+
+def test_word_at_zero_seconds_votes():
+    reference = make_lyrics(("hello", None, None), ("world", None, None))
+    first = make_lyrics(("hello", 0.0, 0.5), ("world", 0.5, 1.0))
+    second = make_lyrics(("hello", 0.2, 0.6), ("world", 0.6, 1.2))
+
+    merged = merge_lyrics_multi([reference, first, second], weights=[1.0, 3.0, 1.0])
+
+    word = merged.lines[0].words[0]
+    assert word.start == pytest.approx((3 * 0.0 + 0.2) / 4)
+    assert word.end == pytest.approx((3 * 0.5 + 0.6) / 4)
+
+
+def test_majority_text_wins():
+    reference = make_lyrics(("hallo", 1.0, 1.5))
+    sources = [make_lyrics(("hello", 1.0, 1.5)) for _ in range(2)]
+
+    merged = merge_lyrics_multi([reference, *sources])
+
+    assert merged.lines[0].words[0].text == "hello"
+
+
+@pytest.mark.parametrize("weights", [[1.0, 2.0], [1.0, 2.0, 3.0, 4.0]])
+def test_weights_must_match_sources(weights):
+    sources = [make_lyrics(("hello", 1.0, 1.5)) for _ in range(3)]
+
+    with pytest.raises(ValueError, match="3 sources"):
+        merge_lyrics_multi(sources, weights=weights)
@@ -0,0 +1,159 @@
+import statistics
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from lyrics import Line, Lyrics, Word, repair_timings
+
+
+def repair_timings_loop(lyrics: Lyrics) -> Lyrics:
+    """
+    The word by word version repair_timings replaced, as reference.
+    """
+    # correct offset (spotify as source of truth)
+
+    offset_median = statistics.median(
+        [
+            line.start - line.words[0].start
+            for line in lyrics.lines
+            if line.start and line.words and line.words[0].start
+        ]
+    )
+
+    for i, line in enumerate(lyrics.lines):
+        line_offset = offset_median
+
+        if line.words and line.words[0].start:
+            line_offset = line.start - line.words[0].start
+
+        # adjust offset if something is clearly wrong
+
+        if abs(abs(line_offset) - abs(offset_median)) > 1:
+            for word in line.words:
+                if word.start:
+                    word.start = round(word.start + line_offset - offset_median, 2)
+
+                if word.end:
+                    word.end = round(word.end + line_offset - offset_median, 2)
+
+        # correct line start amd end time
+
+        if line.words and line.words[0].start:
+            line.start = line.words[0].start
+
+        elif line.start:
+            line.start = line.start - line_offset
+
+    # offsets have to be corrected upfront, otherwise the following code will not work
+
+    for i, line in enumerate(lyrics.lines):
+        if not line.end and line.words:
+            line.end = line.words[-1].end
+            if not line.end and i + 1 < len(lyrics.lines):
+                line.end = lyrics.lines[i + 1].start
+
+        elif not line.end and line.start:
+            line.end = line.start
+
+        # correct word start and end if not present
+
+        missing_time_words = []
+
+        for j, word in enumerate(line.words):
+            # if first word in line, start time is line start time
+            if not word.start and line.start and j == 0:
+                word.start = line.start
+
+            # if word start time is not present, use previous word end time
+            elif not word.start and j > 0 and line.words[j - 1].end:
+                word.start = line.words[j - 1].end
+
+            # if last word and no end time, use line end time
+            if not word.end and line.end and j == len(line.words) - 1:
+                word.end = line.end
+
+            # if word end time is not present, use next word start time
+            elif not word.end and j < len(line.words) - 1 and line.words[j + 1].start:
+                word.end = line.words[j + 1].start
+
+            if not word.start or not word.end:
+                missing_time_words.append(word)
+
+            # correct missing time words
+            if (word.end or j == len(line.words) - 1) and missing_time_words:
+                start_time = missing_time_words[0].start or line.start
+                end_time = word.end or line.end
+                time_diff = end_time - start_time
+                word_count = len(missing_time_words)
+                time_per_word = time_diff / word_count
+
+                for m, missing_word in enumerate(missing_time_words):
+                    missing_word.start = round(start_time + time_per_word * m, 2)
+                    missing_word.end = round(start_time + time_per_word * (m + 1), 2)
+
+                missing_time_words = []
+
+    return lyrics
+
+
+def random_lines(rng) -> list:
+    """
+    Lines of a song with missing timings and some lines shifted by a few seconds.
+    """
+
+    def maybe(value, p):
+        return None if rng.random() < p else round(float(value), 3)
+
+    lines = []
+    t = rng.uniform(1, 10)
+
+    for _ in range(rng.integers(1, 30)):
+        words = []
+        line_start = t + rng.normal(0, 0.5) + (rng.random() < 0.1) * 3
+
+        for _ in range(rng.integers(0, 8)):
+            duration = rng.uniform(0.1, 0.8)
+            words.append(Word("word", maybe(t, 0.3), maybe(t + duration, 0.3)))
+            t += duration + rng.uniform(0, 0.3)
+
+        lines.append(Line(words, round(line_start, 3), maybe(t, 0.5)))
+        t += rng.uniform(0, 3)
+
+    # the loops need the end of the song
+    lines[-1].end = round(t, 3)
+
+    return lines
+
+
+def get_timings(lyrics: Lyrics) -> list:
+    return [(item.start, item.end) for item in lyrics.lines + lyrics.words]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_repair_timings_matches_loops(seed):
+    rng = np.random.default_rng(seed)
+    compared = 0
+
+    for _ in range(30):
+        lines = random_lines(rng)
+
+        try:
+            expected = repair_timings_loop(Lyrics(deepcopy(lines)))
+        except (statistics.StatisticsError, TypeError):
+            # the loops fail without any line offset or with a gap without start or end
+            continue
+
+        repaired = repair_timings(Lyrics(deepcopy(lines)))
+        compared += 1
+
+        for (x_start, x_end), (y_start, y_end) in zip(
+            get_timings(expected), get_timings(repaired)
+        ):
+            for x, y in ((x_start, y_start), (x_end, y_end)):
+                if x is None:
+                    assert y is None
+                else:
+                    assert y == pytest.approx(x, abs=1e-6)
+
+    assert compared > 0
@@ -0,0 +1,44 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisper")
+pytest.importorskip("whisperx")
+
+from whisper.audio import SAMPLE_RATE
+
+from asr import _verify_transplant
+
+
+@pytest.fixture(scope="module")
+def audio():
+    # a 5 second phrase with a varying envelope, repeated 10 seconds later
+    torch.manual_seed(0)
+    phrase = torch.randn(5 * SAMPLE_RATE) * torch.linspace(0, 1, 5 * SAMPLE_RATE) ** 2
+    audio = torch.zeros(20 * SAMPLE_RATE)
+    audio[2 * SAMPLE_RATE : 7 * SAMPLE_RATE] = phrase
+    audio[12 * SAMPLE_RATE : 17 * SAMPLE_RATE] = phrase
+    return audio
+
+
+def transplant(seg_start, seg_end) -> dict:
+    return {
+        "start": 12.0,
+        "end": 17.0,
+        "seg-text": [" text"] * len(seg_start),
+        "seg-start": seg_start,
+        "seg-end": seg_end,
+    }
+
+
+def test_repeat_is_verified(audio):
+    assert _verify_transplant(audio, transplant([0.0, 2.5], [2.5, 5.0]), 10.0)
+
+
+def test_other_audio_fails(audio):
+    assert not _verify_transplant(audio, transplant([0.0, 2.5], [2.5, 5.0]), 3.0)
+
+
+def test_nothing_verified_fails(audio):
+    assert not _verify_transplant(audio, transplant([], []), 10.0)
+    # every segment is too short to correlate
+    assert not _verify_transplant(audio, transplant([1.0, 3.0], [1.05, 3.05]), 10.0)
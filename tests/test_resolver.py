@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+import requests
+
+import http_client
+from lyrics import Line, Lyrics, Word
+from resolver import resolve_lyrics
+
+
+class FakeProvider:
+    def __init__(self, url):
+        self.url = url
+        self.errors = []
+        self.finished = threading.Event()
+
+    def extract(self, name, audio_file) -> Lyrics:
+        try:
+            response = http_client.get(self.url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.errors.append(e)
+            raise
+        finally:
+            self.finished.set()
+
+        start = 1.0 if response.json()["synced"] else None
+        return Lyrics([Line([Word(name, None, None)], start, None)])
+
+
+@pytest.fixture
+def resolve(fake_server):
+    fallback_calls = []
+
+    def fallback(name, audio_file):
+        fallback_calls.append(name)
+        return Lyrics([Line([Word(name, 0.0, 1.0)], 0.0, 1.0)])
+
+    def resolve(queries, timeout=0.5, budget=1.0):
+        providers = {
+            name: FakeProvider(fake_server.url(f"/{name}?{query}"))
+            for name, query in queries.items()
+        }
+        started_at = time.perf_counter()
+        source, lyrics = resolve_lyrics(
+            "song",
+            None,
+            providers,
+            timeouts={name: timeout for name in providers},
+            budget=budget,
+            fallback=fallback,
+            verbose=False,
+        )
+        return source, time.perf_counter() - started_at, len(fallback_calls), providers
+
+    return resolve
+
+
+def test_fastest_provider_wins(resolve):
+    source, seconds, fallback_calls, _ = resolve(
+        {"slow": "latency=0.4", "fast": "latency=0.05", "slower": "latency=2"}
+    )
+
+    assert source == "fast"
+    assert seconds < 0.3
+    assert fallback_calls == 0
+
+
+def test_failing_and_unsynced_providers_are_skipped(resolve):
+    source, _, fallback_calls, _ = resolve(
+        {
+            "failing": "status=404",
+            "unsynced": "synced=0",
+            "synced": "latency=0.1",
+        }
+    )
+
+    assert source == "synced"
+    assert fallback_calls == 0
+
+
+def test_falls_back_within_budget(resolve):
+    source, seconds, fallback_calls, _ = resolve(
+        {"slow": "latency=2", "failing": "status=404"}
+    )
+
+    assert source == "fallback"
+    assert fallback_calls == 1
+    assert seconds < 1.0
+
+
+def test_abandoned_providers_stop_retrying(resolve, fake_server):
+    source, _, _, providers = resolve(
+        {"fast": "latency=0.05", "retrying": "status=503&retry_after=0.2"}
+    )
+
+    assert source == "fast"
+    assert providers["retrying"].finished.wait(1.0)
+    assert isinstance(providers["retrying"].errors[0], http_client.Cancelled)
+
+    time.sleep(0.5)
+    assert fake_server.count("/retrying") == 1
+
+
+def test_request_timeout_is_clamped_to_provider_timeout(resolve):
+    started_at = time.perf_counter()
+    _, _, _, providers = resolve({"slow": "latency=2"}, timeout=0.3)
+
+    assert providers["slow"].finished.wait(1.0)
+    assert time.perf_counter() - started_at < 1.0
+    assert isinstance(providers["slow"].errors[0], requests.Timeout)
@@ -0,0 +1,169 @@
+import copy
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisper")
+pytest.importorskip("whisperx")
+
+from whisper.decoding import DecodingOptions, DecodingTask
+from whisper.model import ModelDimensions, Whisper
+
+from asr import SpeculativeDecodingTask, transcribe
+
+# small enough to decode on CPU in a test, with the multilingual vocabulary
+DIMS = ModelDimensions(
+    n_mels=80,
+    n_audio_ctx=1500,
+    n_audio_state=64,
+    n_audio_head=2,
+    n_audio_layer=1,
+    n_vocab=51865,
+    n_text_ctx=448,
+    n_text_state=64,
+    n_text_head=2,
+    n_text_layer=2,
+)
+
+
+def random_model(seed) -> Whisper:
+    torch.manual_seed(seed)
+    return Whisper(DIMS).eval()
+
+
+@pytest.fixture(scope="module")
+def model():
+    return random_model(0)
+
+
+@pytest.fixture(scope="module")
+def mel():
+    torch.manual_seed(1)
+    return torch.randn(1, DIMS.n_mels, 2 * DIMS.n_audio_ctx)
+
+
+class Proposals(list):
+    """
+    Proposals of the draft model as (length of the prefix, proposed tokens). With corrupt
+    set to an index, the proposal at that index of every round is replaced by a different
+    token, so that the target model rejects it.
+    """
+
+    corrupt = None
+
+
+@pytest.fixture
+def proposals(monkeypatch):
+    recorded = Proposals()
+    propose = SpeculativeDecodingTask._propose
+
+    def _propose(self, tokens, cache, fed, n):
+        proposed, fed = propose(self, tokens, cache, fed, n)
+        if recorded.corrupt is not None and recorded.corrupt < len(proposed):
+            token = proposed[recorded.corrupt]
+            proposed[recorded.corrupt] = (token + 1) % self.tokenizer.eot
+        recorded.append((tokens.shape[-1], list(proposed)))
+        return proposed, fed
+
+    monkeypatch.setattr(SpeculativeDecodingTask, "_propose", _propose)
+    return recorded
+
+
+def count_accepted(proposals, tokens, sample_begin) -> list:
+    """
+    Number of leading proposed tokens of every round that made it into the output tokens,
+    which start at sample_begin.
+    """
+    accepted = []
+    for prefix_length, proposed in proposals:
+        emitted = tokens[prefix_length - sample_begin :][: len(proposed)]
+        n = 0
+        while n < len(emitted) and emitted[n] == proposed[n]:
+            n += 1
+        accepted.append(n)
+    return accepted
+
+
+def decode(model, mel, draft_model=None, num_draft_tokens=4, **options):
+    options = DecodingOptions(language="en", temperature=0.0, fp16=False, **options)
+    if draft_model is None:
+        task = DecodingTask(model, options)
+    else:
+        task = SpeculativeDecodingTask(model, options, draft_model, num_draft_tokens)
+    return task.run(mel)[0], task.sample_begin
+
+
+@pytest.mark.parametrize("without_timestamps", [False, True])
+@pytest.mark.parametrize("num_draft_tokens", [1, 4])
+def test_same_tokens_with_identical_draft(
+    model, mel, proposals, without_timestamps, num_draft_tokens
+):
+    expected, _ = decode(model, mel, without_timestamps=without_timestamps)
+    result, sample_begin = decode(
+        model,
+        mel,
+        draft_model=copy.deepcopy(model),
+        num_draft_tokens=num_draft_tokens,
+        without_timestamps=without_timestamps,
+    )
+
+    assert result.tokens == expected.tokens
+    assert result.sum_logprob == pytest.approx(expected.sum_logprob, rel=1e-4)
+    assert proposals
+    assert sum(count_accepted(proposals, result.tokens, sample_begin)) > 0
+
+
+@pytest.mark.parametrize("corrupt", [0, 2])
+def test_same_tokens_when_proposals_are_rejected(model, mel, proposals, corrupt):
+    proposals.corrupt = corrupt
+
+    expected, _ = decode(model, mel)
+    result, sample_begin = decode(
+        model, mel, draft_model=copy.deepcopy(model), num_draft_tokens=4
+    )
+
+    assert result.tokens == expected.tokens
+
+    # the draft model agrees with the target model up to the corrupted proposal, which is
+    # rejected after accepting the ones before it
+    accepted = count_accepted(proposals, result.tokens, sample_begin)
+    corrupted = [
+        n for n, (_, proposed) in zip(accepted, proposals) if corrupt < len(proposed)
+    ]
+    assert corrupted
+    assert all(n <= corrupt for n in corrupted)
+    assert corrupt in corrupted
+
+
+def test_same_tokens_with_unrelated_draft(model, mel, proposals):
+    expected, _ = decode(model, mel)
+    result, _ = decode(model, mel, draft_model=random_model(2), num_draft_tokens=4)
+
+    assert result.tokens == expected.tokens
+    assert proposals
+
+
+def test_transcribe_with_draft_model(model, mel):
+    # iter_transcribe expects the mel spectrogram padded by a window
+    padded = torch.cat([mel[0], mel[0]], dim=-1)
+    kwargs = dict(
+        language="en",
+        temperature=0.0,
+        no_speech_threshold=None,
+        fp16=False,
+        show_progress=False,
+    )
+
+    expected = transcribe(model, mel=padded, **kwargs)
+    result = transcribe(
+        model,
+        mel=padded,
+        draft_model=copy.deepcopy(model),
+        num_draft_tokens=4,
+        **kwargs
+    )
+
+    assert expected["segments"]
+    assert [segment["tokens"] for segment in result["segments"]] == [
+        segment["tokens"] for segment in expected["segments"]
+    ]
@@ -0,0 +1,160 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import time
+
+PROFILE_PATH = os.path.expanduser("~/.cache/karaoke-ai/asr_profile.json")
+
+DEFAULT_PROFILE = {
+    "batch_size": 4,
+    "compute_type": "int8",
+    "cpu_threads": 0,  # 0 lets CTranslate2 pick the number of threads
+    "num_workers": 1,
+}
+
+CALIBRATION_SECONDS = 60
+
+
+def get_machine_key() -> str:
+    return f"{platform.node()}-{platform.machine()}-{os.cpu_count()}"
+
+
+def load_asr_profile(profile_path=PROFILE_PATH) -> dict:
+    """
+    Load the fastest faster-whisper configuration stored for this machine, or the defaults.
+    """
+    if not os.path.exists(profile_path):
+        return dict(DEFAULT_PROFILE)
+
+    with open(profile_path, "r") as f:
+        profiles = json.load(f)
+
+    return {**DEFAULT_PROFILE, **profiles.get(get_machine_key(), {})}
+
+
+def save_asr_profile(profile: dict, profile_path=PROFILE_PATH):
+    profiles = {}
+    if os.path.exists(profile_path):
+        with open(profile_path, "r") as f:
+            profiles = json.load(f)
+
+    profiles[get_machine_key()] = profile
+
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    with open(profile_path, "w") as f:
+        json.dump(profiles, f, indent=4)
+
+
+def load_whisperx_model(model_name, device, profile: dict, language=None):
+    """
+    Load a whisperx pipeline whose CTranslate2 model uses the threading of the given profile.
+    """
+    import whisperx
+
+    # whisperx's subclass, its pipeline needs generate_segment_batched and encode
+    from whisperx.asr import WhisperModel
+
+    model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=profile["compute_type"],
+        cpu_threads=profile["cpu_threads"],
+        num_workers=profile["num_workers"],
+    )
+
+    return whisperx.load_model(
+        model_name,
+        device,
+        compute_type=profile["compute_type"],
+        language=language,
+        model=model,
+    )
+
+
+def autotune(
+    calibration_audio_path,
+    model_name="small",
+    device="cpu",
+    language="de",
+    batch_sizes=(1, 2, 4, 8, 16),
+    cpu_threads=None,
+    num_workers=(1, 2, 4),
+    compute_type="int8",
+    profile_path=PROFILE_PATH,
+    verbose=True,
+) -> dict:
+    """
+    Sweep batch size, CTranslate2 threads and workers on a short calibration clip and
+    store the fastest configuration for this machine in the profile file.
+    """
+    import whisperx
+    from whisperx.audio import SAMPLE_RATE
+
+    audio = whisperx.load_audio(calibration_audio_path)
+    audio = audio[: CALIBRATION_SECONDS * SAMPLE_RATE]
+
+    if cpu_threads is None:
+        cpu_count = os.cpu_count() or 1
+        cpu_threads = sorted(
+            {1, max(cpu_count // 4, 1), max(cpu_count // 2, 1), cpu_count}
+        )
+
+    best_profile = None
+    best_seconds = None
+
+    for threads, workers in itertools.product(cpu_threads, num_workers):
+        profile = {
+            "compute_type": compute_type,
+            "cpu_threads": threads,
+            "num_workers": workers,
+        }
+        model = load_whisperx_model(model_name, device, profile, language=language)
+
+        for batch_size in batch_sizes:
+            started_at = time.perf_counter()
+            model.transcribe(audio, batch_size=batch_size, language=language)
+            seconds = time.perf_counter() - started_at
+
+            if verbose:
+                print(
+                    f"batch_size={batch_size} cpu_threads={threads} "
+                    f"num_workers={workers}: {seconds:.2f}s"
+                )
+
+            if best_seconds is None or seconds < best_seconds:
+                best_seconds = seconds
+                best_profile = {**profile, "batch_size": batch_size}
+
+        del model
+
+    save_asr_profile(best_profile, profile_path)
+
+    if verbose:
+        print(f"Fastest configuration ({best_seconds:.2f}s): {best_profile}")
+        print(f"Saved to {profile_path}")
+
+    return best_profile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("file", type=str)
+
+    parser.add_argument("-m", "--model", type=str, default="small")
+    parser.add_argument("-l", "--language", type=str, default="de")
+    parser.add_argument("-p", "--profile", type=str, default=PROFILE_PATH)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    autotune(
+        args.file,
+        model_name=args.model,
+        language=args.language,
+        profile_path=args.profile,
+    )